@@ -0,0 +1,74 @@
+"""
+Entity memory benchmark.
+
+Measures how many bytes a single entity takes, using a 200x200 area with a
+wall doodad at every position. Run from the repository root:
+
+    python benchmarks/entity_memory.py
+"""
+
+
+import os
+import sys
+import tracemalloc
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+
+import sw.area as area
+from sw.doodad import Wall
+
+
+WIDTH = 200
+HEIGHT = 200
+
+
+def measure(func):
+    """
+    Measure memory allocated by a function and still held after it returns.
+
+    :param func: a function without arguments.
+
+    :return: the result of the function and the amount of bytes.
+    :rtype: tuple
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    res = func()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return res, size
+
+
+def make_walls():
+    """ Create a wall for every position of the area. """
+    return [Wall("stone wall") for _ in range(WIDTH * HEIGHT)]
+
+
+def fill_area(walls):
+    """ Place walls at every position of a fresh area. """
+    res = area.Area(None)
+    res.width = WIDTH
+    res.height = HEIGHT
+    res.reset_terrain()
+    positions = ((x, y) for x in range(WIDTH) for y in range(HEIGHT))
+    for wall, (x, y) in zip(walls, positions):
+        res.add_entity(wall, x, y)
+    return res
+
+
+def main():
+    """ Run the benchmark and print the results. """
+    count = WIDTH * HEIGHT
+    walls, objects_size = measure(make_walls)
+    _, placed_size = measure(lambda: fill_area(walls))
+    print(f"{count} walls in a {WIDTH}x{HEIGHT} area")
+    print(f"entity objects:     {objects_size / count:8.1f} bytes per entity")
+    print(f"area bookkeeping:   {placed_size / count:8.1f} bytes per entity")
+    print(f"total:              {(objects_size + placed_size) / count:8.1f} bytes per entity")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Save round-trip check and benchmark.
+
+Saves a game with a partly explored area with edited terrain, monsters and an
+item the player has picked up, loads it back and checks that nothing was lost. Then measures save
+and load times for a world with every area of the overworld buffer visited.
+Run from the repository root:
+
+    python benchmarks/save_roundtrip.py
+"""
+
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+
+import sw.const.visibility as visc
+import sw.gamedata as gamedata
+import sw.gamestate as gamestate
+from sw.interaction.item import pick_up_item
+import sw.player as player
+import sw.world as world
+
+
+SEED = 12345
+MONSTER_POSITIONS = ((3, 3), (15, 4), (10, 16))
+ITEM_POSITIONS = ((5, 5), (12, 12))
+# Positions whose terrain is changed after the area is generated
+TERRAIN_EDITS = (((0, 7), None), ((8, 8), "stone wall"))
+
+
+class SilentUI():
+    """ A stand-in for the UI which ignores everything. """
+
+    def message(self, msg, channel):
+        pass
+
+    def death_animation(self, entity):
+        pass
+
+
+def make_game(data):
+    """
+    Create a game with the player in the area at the overworld origin.
+
+    :return: the game state.
+    :rtype: sw.gamestate.GameState
+    """
+    state = gamestate.game_state_from_scratch(data)
+    state.ui = SilentUI()
+    state.world = world.world_from_scratch(data, SEED)
+    state.player = player.player_from_scratch("Tester", data.species[0], data.backgrounds[0])
+    state.player.update_totals(state)
+    state.player.health = state.player.max_health
+    state.area = state.world.load_area(*state.player_position)
+    state.area.add_entity(state.player, 2, 2)
+    for (x, y), recipe_id in TERRAIN_EDITS:
+        state.area.set_terrain(x, y, recipe_id)
+    prototype = data.monster_prototype_by_id("debug melee zombie")
+    for x, y in MONSTER_POSITIONS:
+        monster = prototype.clone()
+        monster.tick(state)
+        monster.health = monster.max_health
+        state.area.add_entity(monster, x, y)
+    prototype = data.item_prototype_by_id("debug dagger")
+    for x, y in ITEM_POSITIONS:
+        state.area.add_entity(prototype.clone(), x, y)
+    state.area.update_visibility_matrix()
+    return state
+
+
+def snapshot(state):
+    """
+    :return: the parts of the game state that must survive a round trip.
+    :rtype: tuple
+    """
+    area = state.area
+    levels = bytes(area.visibility_matrix.explored_levels())
+    inventory = {slot: [item.recipe_id for item in items if item]
+                 for slot, items in state.player.inventory.items()}
+    monsters = sorted((monster.position, monster.health) for monster in area.monsters)
+    items = sorted(item.position for item in area.items if not item.hidden())
+    visible = sorted(pos for pos in area.all_coordinates()
+                     if area.visibility_matrix.visible(*pos))
+    terrain = sorted((x, y, doodad.recipe_id) for x, y, doodad in area.all_terrain())
+    return (state.player.position, state.player.health, inventory, monsters, items, levels,
+            visible, terrain)
+
+
+def check_round_trip(data, directory):
+    """ Save a game, load it back and compare. """
+    state = make_game(data)
+    item = next(iter(state.area.items_at(*ITEM_POSITIONS[0], True)))
+    pick_up_item(item, state.player, state, False)
+    state.area.shift_entity(state.player, 1, 1)
+    state.area.update_visibility_matrix()
+    expected = snapshot(state)
+    gamestate.save_game(state, directory)
+    loaded = gamestate.load_game(data, directory)
+    names = ("player position", "player health", "inventory", "monsters", "items",
+             "explored positions", "visible positions", "terrain")
+    for name, old, new in zip(names, expected, snapshot(loaded)):
+        if old != new:
+            raise SystemExit(f"round trip changed {name}: {old!r} -> {new!r}")
+    never_seen = expected[5].count(visc.VisibilityLevel.NEVER_SEEN)
+    print(f"round trip: OK ({never_seen} positions never seen)")
+    state.close()
+    loaded.close()
+
+
+def benchmark(data, directory):
+    """ Measure save and load times with every buffered area visited. """
+    state = make_game(data)
+    state.area.remove_player()
+    state.area = None
+    state.world.max_live_areas = len(state.world.area_headers)
+    for x, y in state.world.area_headers:
+        state.world.load_area(x, y)
+    count = len(state.world.live_areas)
+    start = time.perf_counter()
+    gamestate.save_game(state, directory)
+    saved = time.perf_counter()
+    loaded = gamestate.load_game(data, directory)
+    for x, y in loaded.world.area_headers:
+        loaded.world.load_area(x, y)
+    end = time.perf_counter()
+    print(f"{count} visited areas")
+    print(f"save:               {saved - start:8.3f} s")
+    print(f"load, every area:   {end - saved:8.3f} s")
+    state.close()
+    loaded.close()
+
+
+def main():
+    """ Run the check and the benchmark. """
+    data = gamedata.GameData()
+    directory = tempfile.mkdtemp(prefix="sw-save-")
+    try:
+        check_round_trip(data, os.path.join(directory, "round trip"))
+        benchmark(data, os.path.join(directory, "benchmark"))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -9,13 +9,11 @@ choose an action for a monster.
 from collections import deque
 
 
-from multipledispatch import dispatch
-
-
 import sw.const.ai as const
 
 import sw.interaction.monster as mi
 
+from sw.dispatch import dispatch
 import sw.gamestate as gs
 import sw.misc as misc
 import sw.monster as mon
@@ -28,29 +26,92 @@ def ai_turn(state):
     """
     Make AI-controlled entities do something.
 
+    The action points spent by the player since the last call are passed to the
+    turn scheduler of the area, which lets monsters act in the order they
+    become ready.
+
     :param state: game state to be modified by the active entities.
     :type state: sw.gamestate.GameState
-    :param float actions: the amount of action points to be added to the
-    entities' action point pools.
     """
     if state.area is None:
         return
-    for monster in state.area.all_monsters(True):
-        if monster.hidden():
-            continue
-        monster.action_points += state.ai_action_points
-        task = evaluate_ai_action(monster.ai, monster, state)
-        required_action_points = 0
-        while required_action_points is not None:
-            monster.action_points -= required_action_points
-            if task[0] is const.Task.CARRY_ON:
-                required_action_points = mi.carry_on(monster, state)
-            else:
-                required_action_points = mi.start_new_task(monster, task, state)
-            task = evaluate_ai_action(monster.ai, monster, state)
+    player = state.player
+    if player is not None and player.position is not None:
+        state.area.wake_monsters_near(*player.position, const.WAKE_DISTANCE)
+    state.area.turn_scheduler.advance(
+        state.ai_action_points,
+        lambda monster, action_points: take_turn(monster, action_points, state))
     state.ai_action_points = 0
 
 
+def take_turn(monster, action_points, state):
+    """
+    Make a monster perform a single action.
+
+    :param monster: a monster whose turn it is.
+    :type monster: sw.monster.Monster
+    :param float action_points: the amount of action points the monster has
+    accumulated since its last turn.
+    :param state: a global environment.
+    :type state: sw.gamestate.GameState
+
+    :return: the delay (in action points) until the monster is ready to act
+    again or None if it's dead and shouldn't act anymore.
+    :rtype: float or None
+    """
+    if not monster.alive():
+        return None
+    if monster.hidden():
+        return const.IDLE_DELAY
+    if should_fall_dormant(monster, state):
+        monster.action_points = 0
+        monster.fall_dormant()
+        return const.IDLE_DELAY
+    monster.action_points += action_points
+    for _ in range(const.MAX_FREE_ACTIONS):
+        task = evaluate_ai_action(monster.ai, monster, state)
+        if task[0] is const.Task.CARRY_ON:
+            spent = mi.carry_on(monster, state)
+        else:
+            spent = mi.start_new_task(monster, task, state)
+        if spent != 0:
+            break
+    required = mi.task_cost(monster, monster.ai.last_task(), state)
+    if not spent:
+        if required is not None and required > monster.action_points:
+            return required - monster.action_points
+        return const.IDLE_DELAY
+    monster.action_points -= spent
+    if required is None:
+        return 0
+    return max(required - monster.action_points, 0)
+
+
+def should_fall_dormant(monster, state):
+    """
+    Decide if a monster can be left alone until something wakes it up, that
+    is if the player is far away, or if the monster is not alarmed and the
+    player is out of sight.
+
+    :param monster: a monster to check.
+    :type monster: sw.monster.Monster
+    :param state: a global environment.
+    :type state: sw.gamestate.GameState
+
+    :return: True if the monster should fall dormant, False otherwise.
+    :rtype: bool
+    """
+    player = state.player
+    if player is None or player.position is None:
+        return True
+    distance = misc.dist(monster.position, player.position)
+    if distance > const.DORMANCY_DISTANCE:
+        return True
+    if monster.ai.alarmed:
+        return False
+    return distance > const.WAKE_DISTANCE and not state.area.can_see(monster, *player.position)
+
+
 #--------- AI selector ---------#
 
 
@@ -93,6 +154,11 @@ class AI():
         except IndexError:
             return None
 
+    def calm_down(self):
+        """ Forget about the alarm once its cause can't be found. """
+        self.alarmed = False
+        self.alarm_coordinates = None
+
 
 class MeleeZombie(AI):
     """ A very dumb AI. """
@@ -141,6 +207,8 @@ def evaluate_ai_action(ai, monster, state):
             ai.chosen_path = None
             return (const.Task.PURSUE, player)
         return (const.Task.CARRY_ON,)
+    if ai.alarmed and ai.alarm_coordinates in (None, monster.position):
+        ai.calm_down()
     if ai.alarmed:
         last_task = ai.last_task()
         if (last_task is None
@@ -6,23 +6,39 @@ Provides Area class, a container of game entities.
 
 
 from collections import deque
-from itertools import chain
+from heapq import heappop, heappush
+from itertools import chain, count, islice
 import random as rand
 
 
-from multipledispatch import dispatch
-
-
 import sw.const.area as const
+import sw.const.stat as stat
 import sw.const.visibility as visc
-from sw.doodad import doodad_from_recipe, Doodad
-from sw.item import Item
+from sw.doodad import Doodad, doodad_from_save, doodad_to_save
+from sw.dispatch import dispatch
+import sw.fov as fov
+from sw.item import Item, item_from_save, item_to_save
 import sw.misc as misc
-from sw.monster import Monster
+from sw.modifier_schedule import ModifierSchedule
+from sw.monster import Monster, monster_from_save, monster_to_save
 from sw.player import Player
+from sw.spatial_index import SpatialIndex
+from sw.turn_scheduler import TurnScheduler
 import sw.visibility as vis
 
 
+# Offsets of the eight neighbours of a position
+NEIGHBOUR_OFFSETS = (
+    (1, 0),
+    (1, -1),
+    (0, -1),
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+    (0, 1),
+    (1, 1))
+
+
 #--------- parent classes ---------#
 
 
@@ -30,7 +46,8 @@ class HasDoodads():
     """ A container for doodads. """
 
     def __init__(self):
-        self.doodads = deque()
+        self.doodads = {}
+        self.doodad_index = SpatialIndex()
 
     def all_doodads(self, living_flag):
         """
@@ -61,10 +78,9 @@ class HasDoodads():
         :return: an iterator with doodads at the given position.
         :rtype: iter[sw.doodad.Doodad]
         """
-        pos = (at_x, at_y)
         cond = lambda d: ((living_flag and d.alive())
                           or (not living_flag and not d.alive()))
-        return (d for d in self.doodads if cond(d) and d.position == pos)
+        return filter(cond, self.doodad_index.at(at_x, at_y))
 
     def hidden_doodads(self):
         """
@@ -73,16 +89,24 @@ class HasDoodads():
         """
         return filter(lambda d: d.hidden(), self.doodads)
 
-    def remove_dead_doodads(self):
-        """ Remove all dead doodads. """
-        self.doodads = deque((d for d in self.doodads if d.alive()))
+    def remove_doodad(self, doodad):
+        """
+        Remove a doodad from the container.
+
+        :param doodad: the doodad to remove.
+        :type doodad: sw.doodad.Doodad
+        """
+        if doodad in self.doodads:
+            del self.doodads[doodad]
+            self.doodad_index.remove(doodad)
 
 
 class HasItems():
     """ A container for items. """
 
     def __init__(self):
-        self.items = deque()
+        self.items = {}
+        self.item_index = SpatialIndex()
 
     def all_items(self, living_flag):
         """
@@ -120,19 +144,26 @@ class HasItems():
         """
         cond = lambda it: ((living_flag and it.alive())
                            or (not living_flag and not it.alive()))
-        pos = (at_x, at_y)
-        return (it for it in self.items if cond(it) and it.position == pos)
+        return filter(cond, self.item_index.at(at_x, at_y))
 
-    def remove_dead_items(self):
-        """ Remove all dead items. """
-        self.items = deque((i for i in self.items if i.alive()))
+    def remove_item(self, item):
+        """
+        Remove a item from the container.
+
+        :param item: the item to remove.
+        :type item: sw.item.Item
+        """
+        if item in self.items:
+            del self.items[item]
+            self.item_index.remove(item)
 
 
 class HasMonsters():
     """ A container for monsters. """
 
     def __init__(self):
-        self.monsters = deque()
+        self.monsters = {}
+        self.monster_index = SpatialIndex()
 
     def all_monsters(self, living_flag):
         """
@@ -172,14 +203,34 @@ class HasMonsters():
         :return: a list of monsters at the given position.
         :rtype: list[sw.monster.Monster]
         """
-        pos = (at_x, at_y)
         cond = lambda m: ((living_flag and m.alive())
                           or (not living_flag and not m.alive()))
-        return [m for m in self.monsters if cond(m) and m.position == pos]
+        return [m for m in self.monster_index.at(at_x, at_y) if cond(m)]
 
-    def remove_dead_monsters(self):
-        """ Remove all dead monsters. """
-        self.monsters = deque((m for m in self.monsters if m.alive()))
+    def monsters_near(self, x, y, radius):
+        """
+        Return a list with all living monsters within a given distance from a
+        position.
+
+        :param int x: the X coordinate of the position.
+        :param int y: the Y coordinate of the position.
+        :param int radius: the maximum distance (in Chebyshev metric).
+
+        :return: a list of monsters.
+        :rtype: list[sw.monster.Monster]
+        """
+        return [m for m in self.monster_index.near(x, y, radius) if m.alive()]
+
+    def remove_monster(self, monster):
+        """
+        Remove a monster from the container.
+
+        :param monster: the monster to remove.
+        :type monster: sw.monster.Monster
+        """
+        if monster in self.monsters:
+            del self.monsters[monster]
+            self.monster_index.remove(monster)
 
 
 #--------- main class ---------#
@@ -199,10 +250,24 @@ class Area(HasDoodads, HasItems, HasMonsters):
         HasItems.__init__(self)
         HasMonsters.__init__(self)
         self.data = data
+        self.seed = None
+        self.biome = None
         self.width = None
         self.height = None
         self.player = None
-        self.visibility_matrix = {}
+        self.visibility_matrix = None
+        self.visible_now = set()
+        self.distance_fields = {}
+        self.distance_fields_origin = None
+        self.terrain = bytearray()
+        self.terrain_doodads = [None]
+        self.terrain_masks = [0]
+        self.terrain_ids = {}
+        self.modifier_schedule = ModifierSchedule()
+        self.turn_scheduler = TurnScheduler()
+        # Entities that have died and are yet to be removed, in the order of
+        # their deaths
+        self.dead_entities = []
 
     #--------- geometry ---------#
 
@@ -255,19 +320,121 @@ class Area(HasDoodads, HasItems, HasMonsters):
         :return: coordinate pairs.
         :rtype: tuple(int, int)
         """
-        # Uses DDA algorithm
-        dx = to_x - from_x
-        dy = to_y - from_y
-        curx, cury = from_x, from_y
-        n = max(abs(dx), abs(dy))
-        last = (curx, cury)
-        for _ in range(n):
-            yield last
-            curx += dx / n
-            cury += dy / n
-            last = (int(curx), int(cury))
-        if last != (to_x, to_y):
-            yield (to_x, to_y)
+        return fov.line(from_x, from_y, to_x, to_y)
+
+    def distance_field(self, entity, from_x, from_y, radius):
+        """
+        Compute walking distances from a given point to every point reachable
+        from it by a given entity within a given radius.
+
+        Characters are ignored, since they move around all the time; only
+        things like walls are considered obstacles.
+
+        :param entity: an entity whose collision rules are used.
+        :type entity: sw.entity.Entity
+        :param int from_x: the X coordinate of the starting point.
+        :param int from_y: the Y coordinate of the starting point.
+        :param int radius: the maximum distance to compute.
+
+        :return: a mapping from positions to their distance to the starting
+        point.
+        :rtype: dict(tuple(int, int), int)
+        """
+        origin = (from_x, from_y)
+        res = {origin: 0}
+        blocked = set()
+        frontier = deque([origin])
+        width = self.width
+        height = self.height
+        blocked_by = entity.blocked_by_mask
+        doodad_mask_at = self.doodad_index.mask_at
+        item_mask_at = self.item_index.mask_at
+        while frontier:
+            cur = frontier.popleft()
+            distance = res[cur] + 1
+            if distance > radius:
+                continue
+            x, y = cur
+            for dx, dy in NEIGHBOUR_OFFSETS:
+                nx = x + dx
+                ny = y + dy
+                neighbour = (nx, ny)
+                if neighbour in res or neighbour in blocked:
+                    continue
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                if blocked_by & self.terrain_masks[self.terrain[ny * width + nx]]:
+                    blocked.add(neighbour)
+                    continue
+                if not blocked_by & (doodad_mask_at(nx, ny) | item_mask_at(nx, ny)):
+                    res[neighbour] = distance
+                    frontier.append(neighbour)
+                    continue
+                blockers = chain(self.doodad_index.at(nx, ny), self.item_index.at(nx, ny))
+                if any(blocker.alive() and entity.can_be_blocked_by(blocker)
+                       for blocker in blockers):
+                    blocked.add(neighbour)
+                    continue
+                res[neighbour] = distance
+                frontier.append(neighbour)
+        return res
+
+    def downhill_step(self, entity, field):
+        """
+        Find the neighbouring position that brings an entity closer to the
+        origin of a distance field the most.
+
+        :param entity: the entity to make a step for.
+        :type entity: sw.entity.Entity
+        :param dict field: a distance field as returned by distance_field.
+
+        :return: the position to step to, or None if every position closer to
+        the origin is occupied or the entity is outside the field.
+        :rtype: tuple(int, int) or None
+        """
+        best_distance = field.get(entity.position)
+        if best_distance is None:
+            return None
+        res = None
+        for neighbour in self.neighbours(*entity.position):
+            distance = field.get(neighbour)
+            if distance is None or distance >= best_distance:
+                continue
+            if self.can_place_entity(entity, *neighbour):
+                res = neighbour
+                best_distance = distance
+        return res
+
+    def invalidate_distance_fields(self):
+        """ Drop cached distance-to-player fields. """
+        self.distance_fields = {}
+        self.distance_fields_origin = None
+
+    def player_distance_field(self, entity):
+        """
+        Return a distance-to-player field for a given entity.
+
+        Fields are shared by all entities with the same collision rules and are
+        recomputed only after the player moves.
+
+        :param entity: the entity to get the field for.
+        :type entity: sw.entity.Entity
+
+        :return: a distance field or None if the player is not in the area.
+        :rtype: dict(tuple(int, int), int) or None
+        """
+        player = self.player
+        if player is None or player.position is None:
+            return None
+        if self.distance_fields_origin != player.position:
+            self.distance_fields = {}
+            self.distance_fields_origin = player.position
+        key = entity.blocked_by_mask
+        res = self.distance_fields.get(key)
+        if res is None:
+            res = self.distance_field(entity, *player.position, const.DISTANCE_FIELD_RADIUS)
+            self.distance_fields[key] = res
+        return res
 
     def neighbours(self, x, y):
         """
@@ -279,62 +446,71 @@ class Area(HasDoodads, HasItems, HasMonsters):
         :return: a generator with all neighbours of a position.
         :rtype: iter
         """
-        offsets = [
-            (1, 0),
-            (1, -1),
-            (0, -1),
-            (-1, -1),
-            (-1, 0),
-            (-1, 1),
-            (0, 1),
-            (1, 1)]
-        for dx, dy in offsets:
+        for dx, dy in NEIGHBOUR_OFFSETS:
             if self.contains_point(x + dx, y + dy):
                 yield x + dx, y + dy
 
-    def path(self, entity, to_x, to_y):
+    def path(self, entity, to_x, to_y, max_expansions=const.MAX_PATH_EXPANSIONS):
         """
         Compute a path from an entity's current position to a given position.
 
+        Uses A* search with a binary heap as the open set. Every step, diagonal
+        ones included, costs the same, so Chebyshev distance is used as a
+        consistent heuristic. Among equally good nodes the ones closer to the
+        goal are expanded first, then the ones discovered earlier.
+
+        The target position itself is never considered blocked, so that a path
+        to an occupied spot (such as another character) can be found.
+
         :param entity: an entity to compute the path for.
         :type entity: sw.entity.Entity
         :param int to_x: the X coordinate of the target point.
         :param int to_y: the Y coordinate of the target point.
+        :param max_expansions: the maximum number of nodes to expand before
+        giving up, or None for no limit.
+        :type max_expansions: int or None
 
         :return: a path to the given position or None if no such path exists
+        or it could not be found within the expansion limit.
         :rtype: deque or None
         """
-        closed_nodes = set()
-        open_nodes = set([entity.position])
-        parent = {}
+        start = entity.position
         goal = (to_x, to_y)
-        own_score = {entity.position: 0}
-        goal_score = {entity.position: misc.dist(entity.position, goal)}
         inf = float("inf")
+        parent = {}
+        cost = {start: 0}
+        closed_nodes = set()
+        tie_breaker = count()
+        heuristic = misc.dist(start, goal)
+        open_nodes = [(heuristic, heuristic, next(tie_breaker), start)]
+        expansions = 0
         while open_nodes:
-            cur = min(open_nodes, key=lambda pos: goal_score.get(pos, inf))
+            cur = heappop(open_nodes)[3]
+            # Stale heap entries are skipped instead of being removed on update
+            if cur in closed_nodes:
+                continue
             if cur == goal:
                 res = deque()
-                while cur != entity.position:
+                while cur != start:
                     res.appendleft(cur)
                     cur = parent[cur]
                 return res
-            open_nodes.remove(cur)
+            expansions += 1
+            if max_expansions is not None and expansions > max_expansions:
+                return None
             closed_nodes.add(cur)
+            new_cost = cost[cur] + 1
             for neighbour in self.neighbours(*cur):
-                if neighbour in closed_nodes:
+                if neighbour in closed_nodes or new_cost >= cost.get(neighbour, inf):
                     continue
                 if neighbour != goal and not self.can_place_entity(entity, *neighbour):
                     closed_nodes.add(neighbour)
                     continue
-                if neighbour not in open_nodes:
-                    open_nodes.add(neighbour)
-                maybe_goal_score = goal_score.get(cur, inf) + misc.dist(cur, neighbour)
-                if maybe_goal_score >= goal_score.get(neighbour, inf):
-                    continue
                 parent[neighbour] = cur
-                goal_score[neighbour] = maybe_goal_score
-                own_score[neighbour] = maybe_goal_score + misc.dist(neighbour, goal)
+                cost[neighbour] = new_cost
+                heuristic = misc.dist(neighbour, goal)
+                heappush(open_nodes,
+                         (new_cost + heuristic, heuristic, next(tie_breaker), neighbour))
         return None
 
     #--------- generic entity manipulation ---------#
@@ -374,6 +550,27 @@ class Area(HasDoodads, HasItems, HasMonsters):
         return filter(lambda blocker: entity.would_be_blocked_by(blocker, at_x, at_y),
                       potential_blockers)
 
+    def blocks_mask_at(self, x, y):
+        """
+        Return the union of collision groups blocked by the terrain and all
+        entities at a given position. Dead entities which haven't been removed
+        yet are included.
+
+        :param int x: the X coordinate of the position, must be in the area.
+        :param int y: the Y coordinate of the position, must be in the area.
+
+        :return: a bitmask of collision groups.
+        :rtype: int
+        """
+        res = (self.terrain_masks[self.terrain[y * self.width + x]]
+               | self.doodad_index.mask_at(x, y)
+               | self.item_index.mask_at(x, y)
+               | self.monster_index.mask_at(x, y))
+        player = self.player
+        if player is not None and player.position == (x, y):
+            res |= player.blocks_mask
+        return res
+
     def can_place_entity(self, entity, at_x, at_y):
         """
         Test if an entity can be placed at a given position.
@@ -388,6 +585,10 @@ class Area(HasDoodads, HasItems, HasMonsters):
         """
         if at_x < 0 or at_y < 0 or at_x >= self.width or at_y >= self.height:
             return False
+        if not entity.blocked_by_mask & self.blocks_mask_at(at_x, at_y):
+            return True
+        if entity.blocked_by_mask & self.terrain_masks[self.terrain[at_y * self.width + at_x]]:
+            return False
         potential_blockers = self.entities_at(at_x, at_y, True)
         for blocker in potential_blockers:
             if entity.would_be_blocked_by(blocker, at_x, at_y):
@@ -441,13 +642,16 @@ class Area(HasDoodads, HasItems, HasMonsters):
         :return: a generator with entities at the given position from the area.
         :rtype: iter[sw.entity.Entity]
         """
-        player = [] if ignore_player or self.player is None else [self.player]
-        doodads = [] if ignore_doodads else self.doodads
-        items = [] if ignore_items else self.items
-        monsters = [] if ignore_monsters else self.monsters
         pos = (x, y)
-        cond = lambda e: ((living_flag and e.alive() or not living_flag and not e.alive())
-                          and (pos == e.position))
+        player = self.player
+        if ignore_player or player is None or player.position != pos:
+            player = []
+        else:
+            player = [player]
+        doodads = [] if ignore_doodads else self.doodad_index.at(x, y)
+        items = [] if ignore_items else self.item_index.at(x, y)
+        monsters = [] if ignore_monsters else self.monster_index.at(x, y)
+        cond = lambda e: living_flag and e.alive() or not living_flag and not e.alive()
         return filter(cond, chain(player, doodads, items, monsters))
 
     def place_entity(self, entity, at_x, at_y):
@@ -470,10 +674,18 @@ class Area(HasDoodads, HasItems, HasMonsters):
         return True
 
     def remove_dead_entities(self):
-        """ Remove all dead entities from the area. """
-        self.remove_dead_doodads()
-        self.remove_dead_items()
-        self.remove_dead_monsters()
+        """
+        Remove all entities that have died since the last removal from the
+        area. Takes time proportional to the number of such entities.
+        """
+        dead = self.dead_entities
+        if not dead:
+            return
+        for entity in dead:
+            entity.death_reported = False
+            if not entity.alive():
+                remove_from_area(self, entity)
+        dead.clear()
 
     def remove_entity(self, entity):
         """
@@ -482,7 +694,20 @@ class Area(HasDoodads, HasItems, HasMonsters):
         :param entity: the entity to be removed.
         :type entity: sw.entity.Entity
         """
-        entity.remove_from_area(self)
+        remove_from_area(self, entity)
+
+    def watch_death(self, entity):
+        """
+        Make an entity report its death to this area, so that it's removed on
+        the next tick.
+
+        :param entity: the entity to watch.
+        :type entity: sw.entity.Entity
+        """
+        entity.death_list = self.dead_entities
+        entity.death_reported = False
+        if not entity.alive():
+            entity.report_death()
 
     def shift_entity(self, entity, dx, dy):
         """
@@ -501,8 +726,105 @@ class Area(HasDoodads, HasItems, HasMonsters):
                                  entity.position[0] + dx,
                                  entity.position[1] + dy)
 
+    #--------- terrain ---------#
+
+    def all_terrain(self):
+        """
+        Iterate over all positions covered by terrain.
+
+        :return: triples (x, y, doodad), where the doodad is the one shared by
+        all positions with the same terrain.
+        :rtype: tuple(int, int, sw.doodad.Doodad)
+        """
+        width = self.width
+        doodads = self.terrain_doodads
+        for index, tile in enumerate(self.terrain):
+            if tile:
+                yield (index % width, index // width, doodads[tile])
+
+    def reset_terrain(self):
+        """ Clear the terrain layer, making it match the area's dimensions. """
+        self.terrain = bytearray(self.width * self.height)
+        self.terrain_doodads = [None]
+        self.terrain_masks = [0]
+        self.terrain_ids = {}
+        self.invalidate_distance_fields()
+
+    def set_terrain(self, x, y, recipe_id):
+        """
+        Put a static doodad into the terrain layer at a given position,
+        replacing whatever terrain was there.
+
+        All positions with the same terrain share a single doodad object, which
+        is not placed anywhere and never ticks.
+
+        :param int x: the X coordinate of the position.
+        :param int y: the Y coordinate of the position.
+        :param recipe_id: the ID of the recipe of the doodad, or None to clear
+        the terrain at the position.
+        :type recipe_id: str or None
+
+        :raises ValueError: if the doodad is not static or if there are too
+        many different terrain doodads in the area.
+        """
+        if recipe_id is None:
+            tile = const.NO_TERRAIN
+        else:
+            tile = self.terrain_tile(recipe_id)
+        self.terrain[y * self.width + x] = tile
+        self.invalidate_distance_fields()
+
+    def terrain_tile(self, recipe_id):
+        """
+        Return the tile ID of a terrain doodad, registering the doodad in the
+        terrain layer if it's not there yet.
+
+        :param str recipe_id: the ID of the recipe of the doodad.
+
+        :return: the tile ID.
+        :rtype: int
+
+        :raises ValueError: if the doodad is not static or if there are too
+        many different terrain doodads in the area.
+        """
+        tile = self.terrain_ids.get(recipe_id)
+        if tile is not None:
+            return tile
+        doodad = self.data.doodad_prototype_by_id(recipe_id).clone()
+        if not doodad.static:
+            raise ValueError(f"Doodad '{recipe_id}' is not static")
+        if len(self.terrain_doodads) > const.MAX_TERRAIN_TILES:
+            raise ValueError("Too many different terrain doodads")
+        tile = len(self.terrain_doodads)
+        self.terrain_doodads.append(doodad)
+        self.terrain_masks.append(doodad.blocks_mask)
+        self.terrain_ids[recipe_id] = tile
+        return tile
+
+    def terrain_at(self, x, y):
+        """
+        Return the terrain doodad at a given position.
+
+        :param int x: the X coordinate of the position, must be in the area.
+        :param int y: the Y coordinate of the position, must be in the area.
+
+        :return: the doodad shared by all positions with the same terrain, or
+        None if there's no terrain at the position.
+        :rtype: sw.doodad.Doodad or None
+        """
+        return self.terrain_doodads[self.terrain[y * self.width + x]]
+
     #--------- player manipulation ---------#
 
+    def remove_player(self):
+        """ Take the player out of the area, e.g. when they leave it. """
+        player = self.player
+        if player is None:
+            return
+        if player.modifier_schedule is self.modifier_schedule:
+            self.modifier_schedule.release(player)
+        self.player = None
+
     def randomly_place_player(self, player):
         """
         Place the player at a random position.
@@ -534,48 +856,130 @@ class Area(HasDoodads, HasItems, HasMonsters):
         if not character.within_sight(x, y):
             return False
         origin_x, origin_y = character.position
-        for cur in self.line(origin_x, origin_y, x, y):
-            if cur == (x, y):
-                break
-            potential_blockers = self.entities_at(cur[0], cur[1], True)
+        offsets = fov.ray(x - origin_x, y - origin_y)
+        # The target point itself does not obstruct the view
+        for dx, dy in islice(offsets, len(offsets) - 1):
+            cur_x = origin_x + dx
+            cur_y = origin_y + dy
+            terrain = self.terrain_at(cur_x, cur_y)
+            if terrain is not None and not vis.is_transparent(terrain, character):
+                return False
+            potential_blockers = self.entities_at(cur_x, cur_y, True)
             for blocker in potential_blockers:
                 if not vis.is_transparent(blocker, character):
                     return False
         return True
 
+    def opaque_positions(self, character, radius):
+        """
+        Collect positions that block the line of sight of a character within a
+        square of a given radius around it.
+
+        :param character: the character whose line of sight is considered.
+        :type character: sw.character.Character
+        :param int radius: the radius of the square to look for obstacles in.
+
+        :return: a set of opaque positions.
+        :rtype: set(tuple(int, int))
+        """
+        res = set()
+        origin_x, origin_y = character.position
+        for x in range(max(0, origin_x - radius), min(self.width, origin_x + radius + 1)):
+            for y in range(max(0, origin_y - radius), min(self.height, origin_y + radius + 1)):
+                terrain = self.terrain_at(x, y)
+                if terrain is not None and not vis.is_transparent(terrain, character):
+                    res.add((x, y))
+                    continue
+                for blocker in self.entities_at(x, y, True):
+                    if not vis.is_transparent(blocker, character):
+                        res.add((x, y))
+                        break
+        return res
+
+    def visible_positions(self, character):
+        """
+        Compute all positions in the area a character can see.
+
+        :param character: the character whose field of view is computed.
+        :type character: sw.character.Character
+
+        :return: a set of visible positions.
+        :rtype: set(tuple(int, int))
+        """
+        radius = int(character.total_secondary[stat.SecondaryStat.SIGHT])
+        origin_x, origin_y = character.position
+        opaque = self.opaque_positions(character, radius)
+        visible = fov.field_of_view(origin_x, origin_y, radius, opaque)
+        return {(x, y) for (x, y) in visible if self.contains_point(x, y)}
+
     def reset_visibility_matrix(self):
         """ Fill the entire visibility matrix with 'NEVER_SEEN' markers. """
-        self.visibility_matrix = {(x, y): vis.VisibilityInfo(visc.VisibilityLevel.NEVER_SEEN)
-                                  for (x, y) in self.all_coordinates()}
+        self.visibility_matrix = vis.VisibilityMatrix(self.width, self.height)
+        self.visible_now = set()
 
     def update_visibility_matrix(self):
         """
         Update the visibility matrix of this area as seen by the given player.
+
+        Only positions within the player's sight and positions that were
+        visible after the previous update are touched.
         """
-        for (x, y), info in self.visibility_matrix.items():
-            if self.can_see(self.player, x, y):
-                info.levels = {visc.VisibilityLevel.VISIBLE}
-                info.remembered_doodads = self.doodads_at(x, y, True)
-                info.remembered_items = self.items_at(x, y, True)
-                info.remembered_monsters = self.monsters_at(x, y, True)
-            else:
-                info.levels.discard(visc.VisibilityLevel.VISIBLE)
+        visible = self.visible_positions(self.player)
+        matrix = self.visibility_matrix
+        for x, y in self.visible_now - visible:
+            matrix.discard_level(x, y, visc.VisibilityLevel.VISIBLE)
+        for x, y in visible:
+            matrix.remember(x, y,
+                            list(self.doodads_at(x, y, True)),
+                            list(self.items_at(x, y, True)),
+                            self.monsters_at(x, y, True))
+        self.visible_now = visible
 
     #--------- other game logic ---------#
 
+    def make_noise(self, x, y, radius):
+        """
+        Alarm (and wake up) all monsters within earshot of a noise.
+
+        :param int x: the X coordinate of the source of the noise.
+        :param int y: the Y coordinate of the source of the noise.
+        :param int radius: how far the noise can be heard.
+        """
+        for monster in self.monsters_near(x, y, radius):
+            monster.alarm((x, y))
+
+    def wake_monsters_near(self, x, y, radius):
+        """
+        Wake up dormant monsters within a given distance from a position.
+
+        :param int x: the X coordinate of the position.
+        :param int y: the Y coordinate of the position.
+        :param int radius: the maximum distance (in Chebyshev metric).
+        """
+        if not self.turn_scheduler.suspended:
+            return
+        for monster in self.monsters_near(x, y, radius):
+            monster.wake_up()
+
     def tick(self, state):
         """
         Process a single game turn.
 
         :param state: the global state of the game.
         :type state: sw.gamestate.GameState
-        :param int action_points_for_ai: the amount of action points to be
-        granted to the AI entities.
         """
-        for entity in self.entities(True, ignore_player=True):
-            entity.tick(state)
-        for entity in self.entities(False, ignore_player=True):
-            entity.death_action(state)
+        # Totals of characters are updated by the modifier schedule, only for
+        # those whose modifiers or base statistics have changed
+        self.modifier_schedule.advance(state)
+        # Death actions can kill other entities, which are then appended to
+        # the list and handled in the same turn
+        dead = self.dead_entities
+        index = 0
+        while index < len(dead):
+            entity = dead[index]
+            index += 1
+            if not entity.alive():
+                entity.death_action(state)
         self.remove_dead_entities()
 
 
@@ -590,7 +994,10 @@ def add_to_area(area, doodad):
     :param Area area: an area to add the doodad to.
     :param Doodad doodad: a doodad to add.
     """
-    area.doodads.append(doodad)
+    area.doodads[doodad] = None
+    area.doodad_index.add(doodad)
+    area.watch_death(doodad)
+    area.invalidate_distance_fields()
 
 
 @dispatch(Area, Item)
@@ -601,7 +1008,9 @@ def add_to_area(area, item):
     :param Area area: an area to add the item to.
     :param Item item: an item to add.
     """
-    area.items.append(item)
+    area.items[item] = None
+    area.item_index.add(item)
+    area.watch_death(item)
 
 
 @dispatch(Area, Monster)
@@ -612,7 +1021,11 @@ def add_to_area(area, monster):
     :param Area area: an area to add the monster to.
     :param Monster monster: a monster to add.
     """
-    area.monsters.append(monster)
+    area.monsters[monster] = None
+    area.monster_index.add(monster)
+    area.watch_death(monster)
+    area.modifier_schedule.adopt(monster)
+    area.turn_scheduler.add(monster)
 
 
 @dispatch(Area, Player)
@@ -624,35 +1037,83 @@ def add_to_area(area, player):
     :param Player player: a player to add.
     """
     area.player = player
+    area.modifier_schedule.adopt(player)
+
+
+@dispatch(Area, Doodad)
+def remove_from_area(area, doodad):
+    """
+    Remove a doodad from an area.
+
+    :param Area area: an area to remove the doodad from.
+    :param Doodad doodad: a doodad to remove.
+    """
+    area.remove_doodad(doodad)
+    doodad.death_list = None
+    area.invalidate_distance_fields()
+
+
+@dispatch(Area, Item)
+def remove_from_area(area, item):
+    """
+    Remove an item from an area.
+
+    :param Area area: an area to remove the item from.
+    :param Item item: an item to remove.
+    """
+    area.remove_item(item)
+    item.death_list = None
+
+
+@dispatch(Area, Monster)
+def remove_from_area(area, monster):
+    """
+    Remove a monster from an area.
+
+    :param Area area: an area to remove the monster from.
+    :param Monster monster: a monster to remove.
+    """
+    area.remove_monster(monster)
+    monster.death_list = None
+    area.modifier_schedule.release(monster)
+    area.turn_scheduler.remove(monster)
 
 
 #--------- area generation from scratch ---------#
 
 
-def area_from_scratch(gamedata, biome, width, height):
+def area_from_scratch(gamedata, biome, width, height, seed=None):
     """
     Generate an area from scratch.
 
+    The area depends only on the arguments, so the same seed always produces
+    the same area.
+
     :param gamedata: an object with game data used to populate the new area.
     :type gamedata: sw.gamedata.GameData
     :param biome: a biome for this area.
     :param int width: the width of the new area.
     :param int height: the height of the new area.
+    :param seed: the seed of the area's random number generator.
+    :type seed: int or None
 
     :return: the freshly created area.
     :rtype: Area
     """
     res = Area(gamedata)
+    res.seed = seed
+    res.biome = biome
     res.width = width
     res.height = height
-    # TODO: proper area generation algorithm
+    res.reset_terrain()
+    # TODO: proper area generation algorithm. Its random choices must come
+    # from 'rand.Random(seed)' only, never from the global generator
     for x, y in res.borders():
-        wall = doodad_from_recipe(gamedata.doodad_recipe_by_id("stone wall"))
-        res.add_entity(wall, x, y)
+        res.set_terrain(x, y, "stone wall")
     res.reset_visibility_matrix()
     return res
 
-#--------- area generation from saved YAML dicts ---------#
+#--------- area generation from saves ---------#
 
 
 def area_from_save(gamedata, save):
@@ -662,6 +1123,196 @@ def area_from_save(gamedata, save):
     :param gamedata: an object with game data used to regenerate area's
     contents.
     :type gamedata: sw.gamedata.GameData
-    :param dict save: a dictionary with the info about the area.
+    :param save: a reader positioned at the area.
+    :type save: sw.save.SaveReader
+
+    :return: the regenerated area, without the player.
+    :rtype: Area
+    """
+    seed = save.read_optional_uint()
+    biome = save.read_id()
+    width = save.read_uint()
+    res = _generated_area(gamedata, biome, width, save.read_uint(), seed)
+    tiles = [const.NO_TERRAIN]
+    for _ in range(save.read_uint()):
+        tiles.append(res.terrain_tile(save.read_id()))
+    for index, tile in _read_changes(save):
+        res.terrain[index] = tiles[tile]
+    res.invalidate_distance_fields()
+    levels = res.visibility_matrix.levels
+    for index, level in _read_changes(save):
+        levels[index] = level
+    res.modifier_schedule.turn = save.read_int()
+    res.turn_scheduler.time = save.read_number()
+    doodads = [doodad_from_save(save, gamedata) for _ in range(save.read_uint())]
+    _add_saved_entities(res, doodads, save.read_positions())
+    items = [item_from_save(save, gamedata) for _ in range(save.read_uint())]
+    _add_saved_entities(res, items, save.read_positions())
+    monsters = []
+    scheduler = res.turn_scheduler
+    for _ in range(save.read_uint()):
+        monster = monster_from_save(save, gamedata)
+        scheduled = save.read_bool()
+        dormant = save.read_bool()
+        turns = (save.read_number(), save.read_number()) if scheduled else None
+        monsters.append((monster, turns, dormant))
+    _add_saved_entities(res, [monster for monster, _, _ in monsters], save.read_positions())
+    for monster, turns, dormant in monsters:
+        if turns is not None:
+            scheduler.reschedule(monster, *turns)
+        elif dormant:
+            monster.fall_dormant()
+        else:
+            scheduler.remove(monster)
+    return res
+
+
+#--------- writing areas to saves ---------#
+
+
+def area_to_save(area, save):
+    """
+    Write an area to a save. Dead entities, hidden entities (e.g. items
+    carried by someone, which are saved along with their carrier) and the
+    player are not written. Of the visibility matrix only the explored
+    levels are kept.
+
+    The terrain and the explored levels are written as changes to the area
+    generated from the seed, so an area the player has barely touched takes
+    little space. Generation places no entities, so all of them are written.
+
+    :param Area area: the area to write.
+    :param save: the writer to write to.
+    :type save: sw.save.SaveWriter
+    """
+    save.write_optional_uint(area.seed)
+    save.write_id(area.biome)
+    save.write_uint(area.width)
+    save.write_uint(area.height)
+    save.write_uint(len(area.terrain_doodads) - 1)
+    for doodad in islice(area.terrain_doodads, 1, None):
+        save.write_id(doodad.recipe_id)
+    generated = _generated_area(area.data, area.biome, area.width, area.height, area.seed)
+    # Tiles of the generated terrain translated to the tiles of the area,
+    # None for doodads the area has no tile for
+    tiles = [const.NO_TERRAIN]
+    for doodad in islice(generated.terrain_doodads, 1, None):
+        tiles.append(area.terrain_ids.get(doodad.recipe_id))
+    if None in tiles:
+        baseline = [tiles[tile] for tile in generated.terrain]
+    else:
+        baseline = generated.terrain.translate(bytes(tiles).ljust(256, b"\0"))
+    _write_changes(save, area.terrain, baseline)
+    _write_changes(save, area.visibility_matrix.explored_levels(),
+                   generated.visibility_matrix.explored_levels())
+    save.write_int(area.modifier_schedule.turn)
+    save.write_number(area.turn_scheduler.time)
+    doodads = [doodad for doodad in area.all_doodads(True) if not doodad.hidden()]
+    save.write_uint(len(doodads))
+    for doodad in doodads:
+        doodad_to_save(doodad, save)
+    save.write_positions([doodad.position for doodad in doodads])
+    items = [item for item in area.all_items(True) if not item.hidden()]
+    save.write_uint(len(items))
+    for item in items:
+        item_to_save(item, save)
+    save.write_positions([item.position for item in items])
+    monsters = [monster for monster in area.all_monsters(True) if not monster.hidden()]
+    scheduler = area.turn_scheduler
+    save.write_uint(len(monsters))
+    for monster in monsters:
+        monster_to_save(monster, save)
+        ready_at = scheduler.ready_at.get(monster)
+        save.write_bool(ready_at is not None)
+        save.write_bool(monster.dormant())
+        if ready_at is not None:
+            save.write_number(ready_at)
+            save.write_number(scheduler.last_turn[monster])
+    save.write_positions([monster.position for monster in monsters])
+
+
+#--------- helper things ---------#
+
+
+def _generated_area(gamedata, biome, width, height, seed):
+    """
+    Regenerate the area a saved area was generated as.
+
+    :param gamedata: an object with game data used to populate the area.
+    :type gamedata: sw.gamedata.GameData
+    :param biome: the biome of the area.
+    :param int width: the width of the area.
+    :param int height: the height of the area.
+    :param seed: the seed of the area, or None if it wasn't generated from one,
+    in which case an empty area is returned.
+    :type seed: int or None
+
+    :return: the generated area.
+    :rtype: Area
+    """
+    if seed is not None:
+        return area_from_scratch(gamedata, biome, width, height, seed)
+    res = Area(gamedata)
+    res.biome = biome
+    res.width = width
+    res.height = height
+    res.reset_terrain()
+    res.reset_visibility_matrix()
+    return res
+
+
+def _read_changes(save):
+    """
+    Read changes written with _write_changes.
+
+    :param save: the reader to read from.
+    :type save: sw.save.SaveReader
+
+    :return: pairs of indices and values, in the order of indices.
+    :rtype: iter(tuple(int, int))
+    """
+    index = 0
+    for _ in range(save.read_uint()):
+        index += save.read_uint()
+        yield index, save.read_uint()
+
+
+def _write_changes(save, values, baseline):
+    """
+    Write the values which differ from a baseline, as pairs of distances from
+    the previous change and new values.
+
+    :param save: the writer to write to.
+    :type save: sw.save.SaveWriter
+    :param values: the values to write, non-negative integers.
+    :type values: bytes or bytearray
+    :param baseline: the values to compare with, of the same length.
+    :type baseline: bytes or bytearray or list
+    """
+    if values == baseline:
+        save.write_uint(0)
+        return
+    changes = [index for index, (value, base) in enumerate(zip(values, baseline))
+               if value != base]
+    save.write_uint(len(changes))
+    previous = 0
+    for index in changes:
+        save.write_uint(index - previous)
+        save.write_uint(values[index])
+        previous = index
+
+
+def _add_saved_entities(area, entities, positions):
+    """
+    Add entities read from a save to an area.
+
+    :param Area area: the area to add the entities to.
+    :param list entities: the entities.
+    :param positions: the positions of the entities.
+    :type positions: list[tuple(int, int)]
+
+    :raises ValueError: if an entity can't be placed at its position.
     """
-    raise NotImplementedError
+    for entity, (x, y) in zip(entities, positions):
+        if not area.add_entity(entity, x, y):
+            raise ValueError(f"Saved entity can't be placed at {(x, y)}")
@@ -29,6 +29,8 @@ class AreaHeader():
         self.biome = None
         self.arcanum_level = ArcanumLevel.ZERO
         self.hostility = HostilityLevel.SAFE
+        # The seed the area is generated from
+        self.seed = None
 
     def load_or_generate_area(self):
         """
@@ -39,30 +41,55 @@ class AreaHeader():
         """
         # TODO: reading areas from a file
         import sw.area as area
-        return area.area_from_scratch(self.data, self.biome, 20, 20)
+        return area.area_from_scratch(self.data, self.biome, 20, 20, self.seed)
 
 
-#--------- header generation from saved YAML dicts ---------#
+#--------- header generation from saves ---------#
 
 
-def area_header_from_save(gamedata, yaml_dict):
+def area_header_from_save(gamedata, save):
     """
-    Generate an area header from a YAML dict.
+    Generate an area header from a save.
 
     :param gamedata: a game data object.
     :type gamedata: sw.gamedata.GameData
-    :param dict yaml_dict: a YAML dict with the saved header info.
+    :param save: a reader positioned at the header.
+    :type save: sw.save.SaveReader
 
     :return: the generated header.
     :rtype: AreaHeader
     """
-    raise NotImplementedError
+    res = AreaHeader(gamedata)
+    res.name = save.read_id()
+    res.biome = save.read_id()
+    res.arcanum_level = save.read_enum(ArcanumLevel)
+    res.hostility = save.read_enum(HostilityLevel)
+    res.seed = save.read_optional_uint()
+    return res
+
+
+#--------- writing headers to saves ---------#
+
+
+def area_header_to_save(header, save):
+    """
+    Write an area header to a save.
+
+    :param AreaHeader header: the header to write.
+    :param save: the writer to write to.
+    :type save: sw.save.SaveWriter
+    """
+    save.write_id(header.name)
+    save.write_id(header.biome)
+    save.write_enum(header.arcanum_level)
+    save.write_enum(header.hostility)
+    save.write_optional_uint(header.seed)
 
 
 #--------- header generation from scratch ---------#
 
 
-def area_header_from_scratch(gamedata, biome, arcanum_level):
+def area_header_from_scratch(gamedata, biome, arcanum_level, seed=None):
     """
     Generate an area header with given parameters.
 
@@ -71,6 +98,8 @@ def area_header_from_scratch(gamedata, biome, arcanum_level):
     :param biome: the biome that should be used for the generated header.
     :param ArcanumLevel arcanum_level: the level of arcanum corruption for the
     generated header.
+    :param seed: the seed to generate the area from.
+    :type seed: int or None
 
     :return: the generated header.
     :rtype: AreaHeader
@@ -79,4 +108,5 @@ def area_header_from_scratch(gamedata, biome, arcanum_level):
     res.name = "TEMP AREA NAME"
     res.biome = biome
     res.arcanum_level = arcanum_level
+    res.seed = seed
     return res
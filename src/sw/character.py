@@ -11,13 +11,21 @@ from collections import deque
 import sw.const.item as citem
 import sw.const.stat as stat
 from sw.entity import Entity
+from sw.item import item_from_save, item_to_save
 import sw.misc as misc
 from sw.modifiable import Modifiable
+from sw.modifier import modifiers_from_save, modifiers_to_save
 
 
 class Character(Entity, Modifiable):
     """ An active game entity. """
 
+    # Modifiable and its bases can't have non-empty slots alongside Entity, so
+    # their attributes are declared here
+    __slots__ = ("_health", "equipment", "inventory",
+                 "totals_dirty", "_base_skills", "total_skills", "_base_stats", "total_stats",
+                 "innate_modifiers", "temp_modifiers", "modifier_schedule", "_dynamic_modifiers")
+
     def __init__(self):
         Entity.__init__(self)
         Modifiable.__init__(self)
@@ -25,6 +33,24 @@ class Character(Entity, Modifiable):
         self.equipment = misc.empty_equipment_dict()
         self.inventory = misc.empty_inventory_dict()
 
+    #--------- cloning ---------#
+
+    def clone(self):
+        res = super().clone()
+        res.base_skills = self.base_skills.copy()
+        res.total_skills = self.total_skills.copy()
+        res.base_stats = {group: stats.copy() for group, stats in self.base_stats.items()}
+        res.total_stats = {group: stats.copy() for group, stats in self.total_stats.items()}
+        res.innate_modifiers = deque(mod.clone() for mod in self.innate_modifiers)
+        res.temp_modifiers = deque(mod.clone() for mod in self.temp_modifiers)
+        res.modifier_schedule = None
+        if self.modifier_schedule is not None:
+            for mod, copied in zip(self.temp_modifiers, res.temp_modifiers):
+                copied.duration = self.modifier_schedule.remaining_duration(mod)
+        res.equipment = _clone_slots(self.equipment)
+        res.inventory = _clone_slots(self.inventory)
+        return res
+
     #--------- item logic ---------#
 
     def add_item_to_equipment_slot(self, item):
@@ -39,6 +65,7 @@ class Character(Entity, Modifiable):
         equip_list = self.equipment[item.wearing_slot]
         index = equip_list.index(None)
         equip_list[index] = item
+        self.invalidate_totals()
 
     def add_item_to_inventory_slot(self, item):
         """
@@ -81,7 +108,7 @@ class Character(Entity, Modifiable):
         """
         inv_list = self.inventory[slot_type]
         num_items = len(list(filter(None, inv_list)))
-        num_slots = self.total_secondary[misc.slot_stat(slot_type)]
+        num_slots = int(self.total_secondary[misc.slot_stat(slot_type)])
         return num_slots - num_items
 
     def has_equipped(self, item):
@@ -138,6 +165,7 @@ class Character(Entity, Modifiable):
             pass
         try:
             self.equipment[self.equipment.index(item)] = None
+            self.invalidate_totals()
             return
         except ValueError:
             pass
@@ -169,7 +197,10 @@ class Character(Entity, Modifiable):
         """
         value = max(0, value)
         value = min(value, self.max_health)
+        was_alive = self._health > 0
         self._health = value
+        if was_alive and value <= 0:
+            self.report_death()
 
     #--------- death logic ---------#
 
@@ -185,24 +216,20 @@ class Character(Entity, Modifiable):
     #--------- other logic ---------#
 
     def tick(self, state):
+        """
+        Update total statistics and skills. Modifiers are ticked and expired
+        by the modifier schedule of the area.
+        """
         self.update_totals(state)
-        for mod in self.innate_modifiers:
-            mod.tick(self, state)
-        remaining_mods = deque()
-        for mod in self.temp_modifiers:
-            mod.tick(self, state)
-            if mod.duration == 0:
-                mod.expire(self, state)
-            else:
-                remaining_mods.append(mod)
-        self.temp_modifiers = remaining_mods
 
     def update_totals(self, state):
+        if not self.totals_outdated():
+            return
         super().update_totals(state)
         for slot_type in citem.InventorySlot:
             inventory_list = self.inventory[slot_type]
             old_len = len(inventory_list)
-            new_len = self.total_secondary[misc.slot_stat(slot_type)]
+            new_len = int(self.total_secondary[misc.slot_stat(slot_type)])
             if new_len > old_len:
                 inventory_list.extend((None for _ in range(new_len - old_len)))
 
@@ -221,3 +248,94 @@ class Character(Entity, Modifiable):
         own_x, own_y = self.position
         return (own_x - sight_range <= x <= own_x + sight_range and
                 own_y - sight_range <= y <= own_y + sight_range)
+
+
+#--------- saving ---------#
+
+
+def read_character_state(character, save, data):
+    """
+    Read the state common to all characters, written by
+    'write_character_state', into a character.
+
+    :param Character character: the character to read into.
+    :param save: a reader positioned at the state.
+    :type save: sw.save.SaveReader
+    :param data: game data used to recreate modifiers and items.
+    :type data: sw.gamedata.GameData
+    """
+    character._health = save.read_number()
+    character.clear_temp_modifiers()
+    character.add_temp_modifiers(*modifiers_from_save(save, data))
+    character.equipment = _slots_from_save(save, data, citem.EquipmentSlot)
+    character.inventory = _slots_from_save(save, data, citem.InventorySlot)
+
+
+def write_character_state(character, save):
+    """
+    Write the state common to all characters to a save: health, temporary
+    modifiers, equipment and inventory.
+
+    :param Character character: the character to write.
+    :param save: the writer to write to.
+    :type save: sw.save.SaveWriter
+    """
+    save.write_number(character.health)
+    modifiers_to_save(character.temp_modifiers, save, character.modifier_schedule)
+    _slots_to_save(character.equipment, save)
+    _slots_to_save(character.inventory, save)
+
+
+#--------- helper things ---------#
+
+
+def _clone_slots(slots):
+    """
+    Copy an equipment or inventory dict, cloning the items in it.
+
+    :param dict slots: the dict to be copied.
+
+    :return: the copy.
+    :rtype: dict
+    """
+    return {slot: [item.clone() if item else item for item in items]
+            for slot, items in slots.items()}
+
+
+def _slots_from_save(save, data, slot_enum):
+    """
+    Read an equipment or inventory dict written by '_slots_to_save'.
+
+    :param save: a reader positioned at the dict.
+    :type save: sw.save.SaveReader
+    :param data: game data used to recreate the items.
+    :type data: sw.gamedata.GameData
+    :param type slot_enum: the enum of the slot types.
+
+    :return: the dict.
+    :rtype: dict
+    """
+    res = {slot: [] for slot in slot_enum}
+    for _ in range(save.read_uint()):
+        items = res[save.read_enum(slot_enum)]
+        for _ in range(save.read_uint()):
+            items.append(item_from_save(save, data) if save.read_bool() else None)
+    return res
+
+
+def _slots_to_save(slots, save):
+    """
+    Write an equipment or inventory dict to a save.
+
+    :param dict slots: the dict to write.
+    :param save: the writer to write to.
+    :type save: sw.save.SaveWriter
+    """
+    save.write_uint(len(slots))
+    for slot, items in slots.items():
+        save.write_enum(slot)
+        save.write_uint(len(items))
+        for item in items:
+            save.write_bool(bool(item))
+            if item:
+                item_to_save(item, save)
@@ -8,6 +8,20 @@ from enum import Enum
 
 REMEMBERED_TASKS_NUM = 10
 
+# How long (in action points) a monster with nothing to do waits before its
+# AI is evaluated again
+IDLE_DELAY = 10
+# The maximum number of free (zero cost) actions a monster can take in a
+# single turn
+MAX_FREE_ACTIONS = 3
+
+# Monsters that are not alarmed fall dormant when they are farther than this
+# from the player
+DORMANCY_DISTANCE = 15
+# Dormant monsters this close to the player are woken up. Should be no less
+# than the sight radius of any monster
+WAKE_DISTANCE = 10
+
 
 class Task(Enum):
     """ An AI task type. """
@@ -6,6 +6,18 @@ Area constants.
 from enum import Enum
 
 
+# The maximum number of nodes a single path search is allowed to expand
+MAX_PATH_EXPANSIONS = 4000
+
+# How far from the player the shared distance-to-player fields extend
+DISTANCE_FIELD_RADIUS = 20
+
+# Tile ID used for positions without terrain
+NO_TERRAIN = 0
+# The maximum number of different terrain doodads in a single area
+MAX_TERRAIN_TILES = 255
+
+
 class ArcanumLevel(Enum):
     """ An enumeration of levels of area's arcanum corruption. """
 
@@ -15,3 +15,7 @@ class CollisionGroup(Enum):
     LIQUID = "liquid"
     CHARACTER = "character"
     WALL = "wall"
+
+
+# Bit flags of collision groups, used to store sets of groups as integers
+COLLISION_MASKS = {group: 1 << i for i, group in enumerate(CollisionGroup)}
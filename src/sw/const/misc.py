@@ -4,3 +4,8 @@ Miscellaneous constants.
 
 # The directory where game data is located
 INSTALLDIR = "severed-world"
+
+# Compiled data cache
+CACHE_DIR_ENV = "XDG_CACHE_HOME"
+DEFAULT_CACHE_DIR = ".cache"
+CACHE_FILE_SUFFIX = ".marshal"
@@ -8,6 +8,9 @@ from enum import Enum
 
 AP_PER_WAIT = 10
 
+# Monsters this close to the player hear the player's attacks and are alarmed
+ATTACK_NOISE_RADIUS = 8
+
 
 class AttackError(Enum):
     """ An error that can happen when attacking. """
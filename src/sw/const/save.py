@@ -0,0 +1,26 @@
+"""
+Constants for the save module.
+"""
+
+
+from enum import Enum
+
+
+# The first bytes of every save file
+MAGIC = b"SWSV"
+# The version of the save format. Files written in other versions can't be
+# loaded
+VERSION = 3
+
+# The name of the file with the game state in a save directory
+GAME_FILE = "game.sav"
+# The extension of the temporary files saves are written to before replacing
+# the old ones
+TEMP_SUFFIX = ".tmp"
+
+
+class RecordKind(Enum):
+    """ The kind of the record stored in a save file. """
+
+    GAME = 1
+    AREA = 2
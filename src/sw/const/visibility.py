@@ -3,14 +3,17 @@ Visibility constants.
 """
 
 
-from enum import Enum
+from enum import IntFlag
 
 
-class VisibilityLevel(Enum):
-    """ An enum with different kinds of location visibility. """
+class VisibilityLevel(IntFlag):
+    """
+    A flag enum with different kinds of location visibility. Several levels
+    can be combined in a single bitmask.
+    """
 
-    NEVER_SEEN = 0
-    SENSE_DOODADS = 1
-    SENSE_ITEMS = 2
-    SENSE_MONSTERS = 3
-    VISIBLE = 4
+    NEVER_SEEN = 1
+    SENSE_DOODADS = 2
+    SENSE_ITEMS = 4
+    SENSE_MONSTERS = 8
+    VISIBLE = 16
@@ -0,0 +1,135 @@
+"""
+Dispatch module.
+
+Provides dispatch decorator used to define functions dispatched on the types of
+all their arguments, and Dispatcher class behind it.
+
+This is a drop-in replacement for multipledispatch.dispatch tuned for calls
+with few arguments: every combination of argument types is resolved only once,
+after that a call costs a single dictionary lookup on top of a direct call.
+"""
+
+
+# Dispatchers, keyed by the names of the functions they dispatch. Like in
+# multipledispatch, functions with the same name share a dispatcher no matter
+# which module they are defined in.
+_DISPATCHERS = {}
+
+
+def dispatch(*types):
+    """
+    Register the decorated function as an implementation of a multi-method
+    for the given argument types.
+
+    :param types: the types of the arguments.
+
+    :return: a decorator returning the multi-method, the same object for all
+    functions with the same name.
+    """
+    def decorator(func):
+        name = func.__name__
+        dispatcher = _DISPATCHERS.get(name)
+        if dispatcher is None:
+            dispatcher = Dispatcher(name)
+            _DISPATCHERS[name] = dispatcher
+        dispatcher.register(types, func)
+        return dispatcher.call
+    return decorator
+
+
+class Dispatcher():
+    """
+    A multi-method: a set of implementations for different argument types.
+
+    The implementation for a combination of argument types is the most
+    specific registered one, that is the one whose signature is matched by the
+    argument types and is not less specific than any other matching signature.
+    Ties are broken in favor of the signature closest to the argument types in
+    their method resolution orders.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.funcs = {}
+        self.cache = {}
+        self.call = self._make_call()
+        self.call.__name__ = name
+        self.call.dispatcher = self
+
+    def register(self, signature, func):
+        """
+        Add an implementation of the multi-method.
+
+        :param tuple signature: the types of the arguments.
+        :param func: the implementation.
+        """
+        self.funcs[signature] = func
+        self.cache.clear()
+        if self.call.__doc__ is None:
+            self.call.__doc__ = func.__doc__
+
+    def resolve(self, types):
+        """
+        Find the implementation for given argument types and cache it.
+
+        :param tuple types: the types of the arguments.
+
+        :return: the implementation.
+
+        :raises NotImplementedError: if no implementation matches the types.
+        """
+        matching = [sig for sig in self.funcs
+                    if len(sig) == len(types) and all(map(issubclass, types, sig))]
+        if not matching:
+            names = ", ".join(t.__name__ for t in types)
+            raise NotImplementedError(f"Could not find signature for {self.name}: <{names}>")
+        best = [sig for sig in matching
+                if not any(_more_specific(other, sig) for other in matching)]
+        best = min(best, key=lambda sig: _mro_distance(types, sig))
+        func = self.funcs[best]
+        self.cache[types] = func
+        return func
+
+    def _make_call(self):
+        """ Create the function to be called in place of the multi-method. """
+        cache = self.cache
+        resolve = self.resolve
+
+        def call(*args):
+            count = len(args)
+            if count == 2:
+                types = (type(args[0]), type(args[1]))
+            elif count == 3:
+                types = (type(args[0]), type(args[1]), type(args[2]))
+            elif count == 4:
+                types = (type(args[0]), type(args[1]), type(args[2]), type(args[3]))
+            else:
+                types = tuple(map(type, args))
+            try:
+                func = cache[types]
+            except KeyError:
+                func = resolve(types)
+            return func(*args)
+
+        return call
+
+
+#--------- helper things ---------#
+
+
+def _more_specific(sig, other):
+    """
+    :return: True if one signature is strictly more specific than another one,
+    False otherwise.
+    :rtype: bool
+    """
+    return sig != other and all(map(issubclass, sig, other))
+
+
+def _mro_distance(types, sig):
+    """
+    :return: the total distance from argument types to the types of a matching
+    signature in their method resolution orders.
+    :rtype: int
+    """
+    return sum(t.__mro__.index(s) for t, s in zip(types, sig))
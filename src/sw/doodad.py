@@ -18,6 +18,8 @@ class Doodad(Entity):
     Some passive or reactive game object - a wall, a water cell, whatever.
     """
 
+    __slots__ = ("recipe_id", "detectable", "detected", "dead", "static")
+
     def __init__(self, recipe_id):
         """
         Initialize a doodad.
@@ -30,6 +32,9 @@ class Doodad(Entity):
         self.detectable = True
         self.detected = True
         self.dead = False
+        # Static doodads never move, die or act, so they can be stored in
+        # the terrain layer of an area instead of being separate objects.
+        self.static = False
 
     #--------- generic usage by other entities ---------#
 
@@ -72,7 +77,9 @@ class Doodad(Entity):
         raise NotImplementedError
 
     def die(self):
-        self.dead = True
+        if not self.dead:
+            self.dead = True
+            self.report_death()
 
     #--------- other logic ---------#
 
@@ -86,8 +93,11 @@ class Doodad(Entity):
 class Wall(Doodad):
     """ A base class for walls. """
 
+    __slots__ = ("transparent",)
+
     def __init__(self, recipe_id):
         super().__init__(recipe_id)
+        self.static = True
         self.transparent = False
         self.add_blocked_by(CollisionGroup.WALL)
         self.add_blocks(CollisionGroup.WALL)
@@ -124,13 +134,34 @@ def doodad_from_recipe(recipe):
 #--------- doodad generation from saves ---------#
 
 
-def doodad_from_save(save):
+def doodad_from_save(save, data):
     """
     Create a doodad from a save.
 
-    :param dict save: the saved information about the doodad.
+    :param save: a reader positioned at the doodad.
+    :type save: sw.save.SaveReader
+    :param data: game data with doodad prototypes.
+    :type data: sw.gamedata.GameData
 
     :return: the recreated doodad.
     :rtype: Doodad
     """
-    raise NotImplementedError
+    res = data.doodad_prototype_by_id(save.read_id()).clone()
+    res.detected = save.read_bool()
+    return res
+
+
+#--------- writing doodads to saves ---------#
+
+
+def doodad_to_save(doodad, save):
+    """
+    Write a doodad to a save. Only the state that differs between doodads
+    made from the same recipe is written.
+
+    :param Doodad doodad: the doodad to write.
+    :param save: the writer to write to.
+    :type save: sw.save.SaveWriter
+    """
+    save.write_id(doodad.recipe_id)
+    save.write_bool(doodad.detected)
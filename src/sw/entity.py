@@ -5,19 +5,97 @@ Provides Entity class from which Doodad and Character classes inherit.
 """
 
 
+from copy import copy
+
+
+from sw.const.entity import COLLISION_MASKS
+
+
 class Entity():
     """
     A thing that can occupy a position and collide with other entities, on one
     hand, and that can die on the other.
+
+    Collision groups are stored as bitmasks of COLLISION_MASKS flags.
+
+    Entities are numerous, so the whole hierarchy uses slots instead of
+    instance dicts. Subclasses must declare __slots__ for their attributes.
     """
 
+    __slots__ = ("spatial_index", "death_list", "death_reported", "_position", "blocks_mask",
+                 "blocked_by_mask")
+
     def __init__(self):
-        self.position = None
-        self.blocks = set()
-        self.blocked_by = set()
+        self.spatial_index = None
+        # A list the entity appends itself to when it dies, so that the area
+        # it's in doesn't have to look for dead entities
+        self.death_list = None
+        # Whether the entity is in its death list already
+        self.death_reported = False
+        self._position = None
+        self.blocks_mask = 0
+        self.blocked_by_mask = 0
+
+    #--------- cloning ---------#
+
+    def clone(self):
+        """
+        Create a copy of this entity, suitable for spawning it from a
+        prototype. The copy is hidden and not registered in any area.
+        Immutable attributes are shared.
+
+        :return: the copy.
+        :rtype: Entity
+        """
+        res = copy(self)
+        res.spatial_index = None
+        res.death_list = None
+        res.death_reported = False
+        res._position = None
+        return res
+
+    #--------- position logic ---------#
+
+    @property
+    def position(self):
+        """
+        :return: the position of the entity or None if it is hidden.
+        :rtype: tuple(int, int) or None
+        """
+        return self._position
+
+    @position.setter
+    def position(self, new):
+        """
+        Set the position of the entity and notify the spatial index the entity
+        is registered in, if any.
+
+        :param new: the new position or None to hide the entity.
+        :type new: tuple(int, int) or None
+        """
+        old = self._position
+        self._position = new
+        if self.spatial_index is not None:
+            self.spatial_index.move(self, old, new)
 
     #--------- collision logic ---------#
 
+    @property
+    def blocked_by(self):
+        """
+        :return: collision groups that block this entity.
+        :rtype: frozenset(sw.const.entity.CollisionGroup)
+        """
+        return _groups_in(self.blocked_by_mask)
+
+    @property
+    def blocks(self):
+        """
+        :return: collision groups that this entity blocks.
+        :rtype: frozenset(sw.const.entity.CollisionGroup)
+        """
+        return _groups_in(self.blocks_mask)
+
     def add_blocked_by(self, group):
         """
         Add a group that will block this entity.
@@ -25,7 +103,7 @@ class Entity():
         :param group: a collision group to be added.
         :type group: sw.const.entity.CollisionGroup
         """
-        self.blocked_by.add(group)
+        self.blocked_by_mask |= COLLISION_MASKS[group]
 
     def add_blocks(self, group):
         """
@@ -34,7 +112,9 @@ class Entity():
         :param group: a collision group to be added.
         :type group: sw.const.entity.CollisionGroup
         """
-        self.blocks.add(group)
+        self.blocks_mask |= COLLISION_MASKS[group]
+        if self.spatial_index is not None and self._position is not None:
+            self.spatial_index.refresh_mask(self._position)
 
     def can_be_blocked_by(self, other):
         """
@@ -48,7 +128,7 @@ class Entity():
         """
         if self is other:
             return False
-        return bool(self.blocked_by.intersection(other.blocks))
+        return self.blocked_by_mask & other.blocks_mask != 0
 
     def distance(self, other):
         """
@@ -116,6 +196,16 @@ class Entity():
         """ Mark this object as dead. """
         raise NotImplementedError
 
+    def report_death(self):
+        """
+        Add the entity to its death list, if any and if it's not there yet.
+        Must be called by subclasses whenever the entity goes from alive to
+        dead.
+        """
+        if self.death_list is not None and not self.death_reported:
+            self.death_reported = True
+            self.death_list.append(self)
+
     #--------- other game logic ---------#
 
     def tick(self, state):
@@ -126,3 +216,16 @@ class Entity():
         :type state: sw.gamestate.GameState
         """
         raise NotImplementedError
+
+
+#--------- helper things ---------#
+
+
+def _groups_in(mask):
+    """
+    :param int mask: a bitmask of collision groups.
+
+    :return: collision groups present in the mask.
+    :rtype: frozenset(sw.const.entity.CollisionGroup)
+    """
+    return frozenset(group for group, bit in COLLISION_MASKS.items() if mask & bit)
@@ -0,0 +1,95 @@
+"""
+Enum vector module.
+
+Provides EnumVector class, a dense mapping from enum members to numbers used to
+store statistics and skills.
+"""
+
+
+from array import array
+from collections.abc import MutableMapping
+
+
+# Mappings from enum members to their positions in vectors, one per enum class
+_INDICES = {}
+
+
+class EnumVector(MutableMapping):
+    """
+    A mapping from every member of an enum to a float.
+
+    Values are stored in a flat array, with each member having a fixed index,
+    so copying a vector is a single buffer copy.
+    """
+
+    __slots__ = ("enum_class", "index", "data")
+
+    def __init__(self, enum_class):
+        """
+        Initialize a vector with all values set to zero.
+
+        :param enum_class: the enum whose members are the keys.
+        :type enum_class: type
+        """
+        self.enum_class = enum_class
+        self.index = _index_of(enum_class)
+        self.data = array("d", [0.0]) * len(self.index)
+
+    def __getitem__(self, key):
+        return self.data[self.index[key]]
+
+    def __setitem__(self, key, value):
+        self.data[self.index[key]] = value
+
+    def __delitem__(self, key):
+        raise TypeError("Cannot remove keys from an EnumVector")
+
+    def __iter__(self):
+        return iter(self.enum_class)
+
+    def __len__(self):
+        return len(self.data)
+
+    def __repr__(self):
+        return f"EnumVector({self.enum_class.__name__}, {dict(self)})"
+
+    def __deepcopy__(self, memo):
+        return self.copy()
+
+    def assign(self, other):
+        """
+        Overwrite all values with values from another vector.
+
+        :param EnumVector other: a vector over the same enum to copy from.
+        """
+        self.data[:] = other.data
+
+    def copy(self):
+        """
+        :return: a copy of this vector.
+        :rtype: EnumVector
+        """
+        res = EnumVector.__new__(EnumVector)
+        res.enum_class = self.enum_class
+        res.index = self.index
+        res.data = self.data[:]
+        return res
+
+
+#--------- helper things ---------#
+
+
+def _index_of(enum_class):
+    """
+    Return a mapping from members of an enum to their positions in vectors.
+
+    :param type enum_class: the enum.
+
+    :return: the mapping.
+    :rtype: dict
+    """
+    res = _INDICES.get(enum_class)
+    if res is None:
+        res = {member: i for i, member in enumerate(enum_class)}
+        _INDICES[enum_class] = res
+    return res
@@ -24,7 +24,9 @@ class SWFlow(Flow):
             self.register_event_source(ui)
 
     def clean_ui(self, exception):
-        """ Clean up the UI. """
+        """ Clean up the UI and the game state. """
+        if self.state is not None:
+            self.state.close()
         self.ui_spawner.finish()
 
     def draw(self):
@@ -0,0 +1,162 @@
+"""
+Field of view module.
+
+Provides field_of_view function which computes the set of positions visible
+from a given point using recursive shadowcasting, as well as line and ray
+functions for tracing individual lines of sight.
+"""
+
+
+# Rays no longer than this (in Chebyshev metric) are cached
+MAX_CACHED_RAY_LENGTH = 32
+
+
+# Coordinate transformation multipliers (xx, xy, yx, yy) for the eight octants.
+_OCTANTS = (
+    (1, 0, 0, 1),
+    (0, 1, 1, 0),
+    (0, -1, 1, 0),
+    (-1, 0, 0, 1),
+    (-1, 0, 0, -1),
+    (0, -1, -1, 0),
+    (0, 1, -1, 0),
+    (1, 0, 0, -1))
+
+# Cached rays, keyed by their relative endpoints
+_RAYS = {}
+
+
+#--------- main things ---------#
+
+
+def field_of_view(origin_x, origin_y, radius, opaque):
+    """
+    Compute positions visible from a given origin.
+
+    The visible region is a square with the origin in its center, matching
+    sw.character.Character.within_sight. Opaque positions are visible
+    themselves, but hide everything behind them.
+
+    :param int origin_x: the X coordinate of the point of view.
+    :param int origin_y: the Y coordinate of the point of view.
+    :param int radius: the maximum distance (in Chebyshev metric) at which
+    things can be seen.
+    :param opaque: a container of positions that block the line of sight.
+    :type opaque: set(tuple(int, int))
+
+    :return: a set of visible positions, the origin included.
+    :rtype: set(tuple(int, int))
+    """
+    res = {(origin_x, origin_y)}
+    if radius < 1:
+        return res
+    for multipliers in _OCTANTS:
+        _cast_light(res, opaque, origin_x, origin_y, radius, 1, 1.0, 0.0,
+                    multipliers)
+    return res
+
+
+def line(from_x, from_y, to_x, to_y):
+    """
+    Iterate over coordinate pairs of points between two given points, ends
+    included, using Bresenham's algorithm.
+
+    :param int from_x: X coordinate of the starting point.
+    :param int from_y: Y coordinate of the starting point.
+    :param int to_x: X coordinate of the endpoint.
+    :param int to_y: Y coordinate of the endpoint.
+
+    :return: coordinate pairs.
+    :rtype: tuple(int, int)
+    """
+    dx = abs(to_x - from_x)
+    dy = -abs(to_y - from_y)
+    step_x = 1 if from_x < to_x else -1
+    step_y = 1 if from_y < to_y else -1
+    error = dx + dy
+    x, y = from_x, from_y
+    while True:
+        yield (x, y)
+        if x == to_x and y == to_y:
+            return
+        double_error = 2 * error
+        if double_error >= dy:
+            error += dy
+            x += step_x
+        if double_error <= dx:
+            error += dx
+            y += step_y
+
+
+def ray(dx, dy):
+    """
+    Return offsets of the points on a line from the origin to a given point,
+    ends included.
+
+    Rays within MAX_CACHED_RAY_LENGTH are computed only once.
+
+    :param int dx: X coordinate of the endpoint relative to the origin.
+    :param int dy: Y coordinate of the endpoint relative to the origin.
+
+    :return: a tuple of offsets, starting with (0, 0).
+    :rtype: tuple(tuple(int, int))
+    """
+    key = (dx, dy)
+    res = _RAYS.get(key)
+    if res is None:
+        res = tuple(line(0, 0, dx, dy))
+        if max(abs(dx), abs(dy)) <= MAX_CACHED_RAY_LENGTH:
+            _RAYS[key] = res
+    return res
+
+
+#--------- helper things ---------#
+
+
+def _cast_light(res, opaque, origin_x, origin_y, radius, row, start, end,
+                multipliers):
+    """
+    Scan a single octant row by row, recursing into the gaps between opaque
+    positions.
+
+    :param set res: a set to add visible positions to.
+    :param opaque: a container of opaque positions.
+    :param int origin_x: the X coordinate of the point of view.
+    :param int origin_y: the Y coordinate of the point of view.
+    :param int radius: the maximum distance.
+    :param int row: the first row to scan.
+    :param float start: the slope of the start of the lit sector.
+    :param float end: the slope of the end of the lit sector.
+    :param tuple multipliers: octant transformation multipliers.
+    """
+    if start < end:
+        return
+    xx, xy, yx, yy = multipliers
+    new_start = start
+    for distance in range(row, radius + 1):
+        dx = -distance - 1
+        dy = -distance
+        blocked = False
+        while dx <= 0:
+            dx += 1
+            left_slope = (dx - 0.5) / (dy + 0.5)
+            right_slope = (dx + 0.5) / (dy - 0.5)
+            if start < right_slope:
+                continue
+            if end > left_slope:
+                break
+            pos = (origin_x + dx * xx + dy * xy, origin_y + dx * yx + dy * yy)
+            res.add(pos)
+            if blocked:
+                if pos in opaque:
+                    new_start = right_slope
+                    continue
+                blocked = False
+                start = new_start
+            elif pos in opaque and distance < radius:
+                blocked = True
+                _cast_light(res, opaque, origin_x, origin_y, radius,
+                            distance + 1, start, left_slope, multipliers)
+                new_start = right_slope
+        if blocked:
+            break
@@ -5,8 +5,14 @@ Game data module.
 
 import sw.ai as ai
 import sw.background as bg
+import sw.const.doodad as constd
 import sw.const.globvars as gv
+import sw.const.item as constitem
+import sw.const.monster as constm
+import sw.doodad as doodad
+import sw.item as item
 import sw.misc as misc
+import sw.monster as monster
 import sw.species as sp
 
 
@@ -21,6 +27,16 @@ class GameData():
         self.species = _read_species()
         self.strings = _read_strings()
         self.uniques_recipes = _read_uniques_recipes()
+        self.doodad_recipes_by_id = _index_recipes(self.doodad_recipes, constd.ID, "doodad")
+        self.item_recipes_by_id = _index_recipes(self.item_recipes, constitem.ID, "item")
+        self.monster_recipes_by_id = _index_recipes(self.monster_recipes, constm.ID, "monster")
+        self.uniques_recipes_by_id = _index_recipes(self.uniques_recipes, constm.ID, "unique")
+        self.doodad_prototypes = {recipe_id: doodad.doodad_from_recipe(recipe)
+                                  for recipe_id, recipe in self.doodad_recipes_by_id.items()}
+        self.item_prototypes = {recipe_id: item.item_from_recipe(recipe, self)
+                                for recipe_id, recipe in self.item_recipes_by_id.items()}
+        self.monster_prototypes = {recipe_id: monster.monster_from_recipe(recipe, self)
+                                   for recipe_id, recipe in self.monster_recipes_by_id.items()}
         globvars = _read_globals()
         self.message_limit = globvars[gv.MESSAGE_LIMIT]
 
@@ -37,6 +53,23 @@ class GameData():
         """
         return ai.create_ai(ai_id)
 
+    def doodad_prototype_by_id(self, doodad_id):
+        """
+        Get a doodad prototype by its ID. New doodads should be made by cloning
+        it.
+
+        :param str doodad_id: the ID to look for.
+
+        :return: a doodad compiled from the recipe with the given ID.
+        :rtype: sw.doodad.Doodad
+
+        :raises ValueError: if there's no recipe with such ID.
+        """
+        try:
+            return self.doodad_prototypes[doodad_id]
+        except KeyError:
+            raise ValueError(f"Unknown doodad ID '{doodad_id}'") from None
+
     def doodad_recipe_by_id(self, doodad_id):
         """
         Get a doodad recipe by its ID.
@@ -48,11 +81,27 @@ class GameData():
 
         :raises ValueError: if there's no recipe with such ID.
         """
-        import sw.const.doodad as constd
-        for recipe in self.doodad_recipes:
-            if recipe[constd.ID] == doodad_id:
-                return recipe
-        raise ValueError(f"Unknown doodad ID '{doodad_id}'")
+        try:
+            return self.doodad_recipes_by_id[doodad_id]
+        except KeyError:
+            raise ValueError(f"Unknown doodad ID '{doodad_id}'") from None
+
+    def item_prototype_by_id(self, item_id):
+        """
+        Get an item prototype by its ID. New items should be made by cloning
+        it.
+
+        :param str item_id: the ID to look for.
+
+        :return: an item compiled from the recipe with the given ID.
+        :rtype: sw.item.Item
+
+        :raises ValueError: if there's no recipe with this ID.
+        """
+        try:
+            return self.item_prototypes[item_id]
+        except KeyError:
+            raise ValueError(f"Unknown item ID '{item_id}'") from None
 
     def item_recipe_by_id(self, item_id):
         """
@@ -65,11 +114,27 @@ class GameData():
 
         :raises ValueError: if there's no recipe with this ID.
         """
-        import sw.const.item as constitem
-        for recipe in self.item_recipes:
-            if recipe[constitem.ID] == item_id:
-                return recipe
-        raise ValueError(f"Unknown item ID '{item_id}'")
+        try:
+            return self.item_recipes_by_id[item_id]
+        except KeyError:
+            raise ValueError(f"Unknown item ID '{item_id}'") from None
+
+    def monster_prototype_by_id(self, recipe_id):
+        """
+        Get a monster prototype by its ID. New monsters should be made by
+        cloning it.
+
+        :param str recipe_id: the ID to look for.
+
+        :return: a monster compiled from the recipe with the given ID.
+        :rtype: sw.monster.Monster
+
+        :raises ValueError: if there's no recipe with such ID.
+        """
+        try:
+            return self.monster_prototypes[recipe_id]
+        except KeyError:
+            raise ValueError(f"Unknown monster ID '{recipe_id}'") from None
 
     def monster_recipe_by_id(self, recipe_id):
         """
@@ -82,11 +147,10 @@ class GameData():
 
         :raises ValueError: if there's no recipe with such ID.
         """
-        import sw.const.monster as constm
-        for recipe in self.monster_recipes:
-            if recipe[constm.ID] == recipe_id:
-                return recipe
-        raise ValueError(f"Unknown monster ID '{recipe_id}'")
+        try:
+            return self.monster_recipes_by_id[recipe_id]
+        except KeyError:
+            raise ValueError(f"Unknown monster ID '{recipe_id}'") from None
 
     def unique_recipe_by_id(self, recipe_id):
         """
@@ -99,16 +163,37 @@ class GameData():
 
         :raises ValueError: if there's no recipe with such ID.
         """
-        import sw.const.monster as constm
-        for recipe in self.uniques_recipes:
-            if recipe[constm.ID] == recipe_id:
-                return recipe
-        raise ValueError(f"Unknown unique ID '{recipe_id}'")
+        try:
+            return self.uniques_recipes_by_id[recipe_id]
+        except KeyError:
+            raise ValueError(f"Unknown unique ID '{recipe_id}'") from None
 
 
 #--------- helper things ---------#
 
 
+def _index_recipes(recipes, id_key, kind):
+    """
+    Build a mapping from recipe IDs to recipes.
+
+    :param list[dict] recipes: the recipes to index.
+    :param str id_key: the key of the ID in the recipe dicts.
+    :param str kind: the kind of the recipes, used in error messages.
+
+    :return: a dict with recipes keyed by their IDs.
+    :rtype: dict(str, dict)
+
+    :raises ValueError: if several recipes share the same ID.
+    """
+    res = {}
+    for recipe in recipes:
+        recipe_id = recipe[id_key]
+        if recipe_id in res:
+            raise ValueError(f"Duplicate {kind} ID '{recipe_id}'")
+        res[recipe_id] = recipe
+    return res
+
+
 def _read_backgrounds():
     """
     Read backgrounds from the data files.
@@ -128,7 +213,6 @@ def _read_doodad_recipes():
     :return: a list of recipes.
     :rtype: list[dict]
     """
-    import sw.const.doodad as constd
     res = misc.read([], "data", constd.DOODAD_RECIPES_FILE)
     return res
 
@@ -151,7 +235,6 @@ def _read_item_recipes():
     :return: a list with recipes.
     :rtype: list[dict]
     """
-    import sw.const.item as constitem
     res = misc.read([], "data", constitem.ITEM_RECIPES_FILE)
     return res
 
@@ -163,7 +246,6 @@ def _read_monster_recipes():
     :return: a list with recipes.
     :rtype: list[dict]
     """
-    import sw.const.monster as constm
     res = misc.read([], "data", constm.MONSTER_RECIPES_FILE)
     return res
 
@@ -199,6 +281,5 @@ def _read_uniques_recipes():
     :return: a list of uniques recipes.
     :rtype: list[dict]
     """
-    import sw.const.monster as constm
     res = misc.read([], "data", constm.UNIQUES_RECIPES_FILE)
     return res
@@ -7,6 +7,15 @@ and various other game data.
 
 
 from collections import deque
+import os
+
+
+from sw.const.message import Channel
+import sw.const.save as const
+from sw.message import Message
+from sw.player import player_from_save, player_to_save
+from sw.save import SaveWriter, open_save
+from sw.world import world_from_save, world_to_save
 
 
 class GameState():
@@ -23,6 +32,11 @@ class GameState():
         self.ui = None
         self.world = None
 
+    def close(self):
+        """ Release the resources held by the game, e.g. on exit. """
+        if self.world is not None:
+            self.world.close()
+
     def current_overworld_header(self):
         """
         :return: the header of the area where the player is located.
@@ -31,22 +45,96 @@ class GameState():
         return self.world.area_headers[self.player_position]
 
 
-#--------- reading game state from a saved YAML dict ---------#
+#--------- reading game state from a save ---------#
 
 
-def game_state_from_save(gamedata, save):
+def game_state_from_save(gamedata, save, directory):
     """
     Read game state from a save.
 
     :param gamedata: an object with game data used to regenerate game objects.
     :type gamedata: sw.gamedata.GameData
-    :param dict save: information about game objects, game configuration and so
-    on.
+    :param save: a reader positioned at the game state.
+    :type save: sw.save.SaveReader
+    :param str directory: the save directory with the area files.
+
+    :return: regenerated game state object.
+    :rtype: GameState
+    """
+    res = GameState()
+    res.data = gamedata
+    res.ai_action_points = save.read_number()
+    res.turn = save.read_int()
+    res.player_position = save.read_position()
+    res.messages = deque(maxlen=gamedata.message_limit)
+    for _ in range(save.read_uint()):
+        text = save.read_str()
+        res.messages.append(Message(text, save.read_enum(Channel)))
+    res.player = player_from_save(save, gamedata)
+    res.player.update_totals(res)
+    res.world = world_from_save(gamedata, save, directory)
+    position = save.read_position()
+    if position is not None:
+        res.area = res.world.load_area(*res.player_position)
+        if not res.area.add_entity(res.player, *position):
+            raise ValueError(f"Saved player can't be placed at {position}")
+        res.area.update_visibility_matrix()
+    return res
+
+
+def load_game(gamedata, directory):
+    """
+    Load a game saved by 'save_game'.
+
+    :param gamedata: an object with game data used to regenerate game objects.
+    :type gamedata: sw.gamedata.GameData
+    :param str directory: the save directory.
 
     :return: regenerated game state object.
     :rtype: GameState
+
+    :raises ValueError: if the save is of an unsupported version.
+    """
+    save = open_save(os.path.join(directory, const.GAME_FILE), const.RecordKind.GAME)
+    return game_state_from_save(gamedata, save, directory)
+
+
+#--------- writing game state to a save ---------#
+
+
+def game_state_to_save(state, save):
+    """
+    Write game state to a save. Areas are not written, see 'save_game'.
+
+    :param GameState state: the state to write.
+    :param save: the writer to write to.
+    :type save: sw.save.SaveWriter
+    """
+    save.write_number(state.ai_action_points)
+    save.write_int(state.turn)
+    save.write_position(state.player_position)
+    save.write_uint(len(state.messages))
+    for message in state.messages:
+        save.write_str(message.text)
+        save.write_enum(message.channel)
+    player_to_save(state.player, save)
+    world_to_save(state.world, save)
+    save.write_position(None if state.area is None else state.player.position)
+
+
+def save_game(state, directory):
+    """
+    Save the game to a directory: the game state into a single file and each
+    visited area into a file of its own, so that loading the game doesn't
+    depend on the number of visited areas.
+
+    :param GameState state: the state to save.
+    :param str directory: the save directory.
     """
-    raise NotImplementedError
+    state.world.save_areas(directory)
+    save = SaveWriter(const.RecordKind.GAME)
+    game_state_to_save(state, save)
+    save.dump(os.path.join(directory, const.GAME_FILE))
 
 
 #--------- creating game state from bottom up ---------#
@@ -5,12 +5,10 @@ Provides functions to work with items.
 """
 
 
-from multipledispatch import dispatch
-
-
 import sw.const.item as ci
 
 import sw.character as c
+from sw.dispatch import dispatch
 import sw.doodad as d
 import sw.gamestate as gs
 import sw.item as i
@@ -6,12 +6,10 @@ possible with a certain item by a certain character.
 """
 
 
-from multipledispatch import dispatch
-
-
 import sw.const.item as ci
 
 import sw.character as c
+from sw.dispatch import dispatch
 import sw.gamestate as gs
 import sw.item as i
 import sw.monster as m
@@ -8,10 +8,8 @@ Provides several functions for interacting with (or by) monsters.
 import random
 
 
-from multipledispatch import dispatch
-
-
 import sw.character as c
+from sw.dispatch import dispatch
 import sw.doodad as d
 import sw.gamestate as gs
 import sw.item as i
@@ -26,6 +24,16 @@ import sw.const.skill as skill
 import sw.const.stat as stat
 
 
+# Tasks that consist of moving around
+_MOVEMENT_TASKS = frozenset((
+    constai.Task.EXPLORE,
+    constai.Task.FOLLOW,
+    constai.Task.INVESTIGATE,
+    constai.Task.PURSUE,
+    constai.Task.RETREAT,
+    constai.Task.STEP_ASIDE))
+
+
 #--------- performing AI tasks - main functions ---------#
 
 
@@ -92,6 +100,35 @@ def perform_task(monster, task, taskargs, state):
         raise ValueError(f"Unknown task '{task}'")
 
 
+def task_cost(monster, task_and_args, state):
+    """
+    Estimate the amount of action points a monster needs to perform the next
+    step of a task.
+
+    :param monster: a monster to perform the task.
+    :type monster: sw.monster.Monster
+    :param task_and_args: a task with its arguments or None.
+    :type task_and_args: tuple or None
+    :param state: a global environment.
+    :type state: sw.gamestate.GameState
+
+    :return: the estimated cost or None if the task doesn't cost anything
+    predictable.
+    :rtype: float or None
+    """
+    if task_and_args is None:
+        return None
+    task = task_and_args[0]
+    if task is constai.Task.ATTACK:
+        weapons = [weapon for weapon in monster.melee_weapons() if weapon is not None]
+        if weapons:
+            return min(attack_speed(monster, weapon, state) for weapon in weapons)
+        return attack_speed(monster, state)
+    if task in _MOVEMENT_TASKS:
+        return movement_speed(monster, state)
+    return None
+
+
 def start_new_task(monster, task_and_args, state):
     """
     Make a monster start some new activity.
@@ -259,7 +296,19 @@ def pursue(monster, who, state):
     :return: movement cost on success, None on failure.
     :rtype: float or None
     """
-    path = monster.ai.chosen_path or state.area.path(monster, *who.position)
+    area = state.area
+    field = area.player_distance_field(monster) if who is state.player else None
+    if field is not None and monster.position in field:
+        move_here = area.downhill_step(monster, field)
+        if move_here is None:
+            return None
+        cost = movement_speed(monster, state)
+        if cost > monster.action_points:
+            return None
+        monster.ai.chosen_path = None
+        area.place_entity(monster, *move_here)
+        return cost
+    path = monster.ai.chosen_path or area.path(monster, *who.position)
     if path is None:
         return None
     monster.ai.chosen_path = path
@@ -271,7 +320,7 @@ def pursue(monster, who, state):
     if cost > monster.action_points:
         return None
     monster.ai.chosen_path.popleft()
-    state.area.place_entity(monster, *move_here)
+    area.place_entity(monster, *move_here)
     return cost
 
 
@@ -6,9 +6,7 @@ Player interactions module.
 import random as rand
 
 
-from multipledispatch import dispatch
-
-
+from sw.dispatch import dispatch
 import sw.doodad as d
 import sw.gamestate as gs
 import sw.item as i
@@ -46,14 +44,15 @@ def attack(player, dagger, monster, state, force):
     :rtype: bool or sw.const.player.AttackError
     """
     # TODO: a to-hit calculation, check if the target is friendly, stabbing, etc...
-    weapon_skill = player.total_skill[skill.Skill.DAGGER]
-    damage = rand.randint(weapon.min_damage, weapon.max_damage)
+    weapon_skill = player.total_skills[skill.Skill.DAGGER]
+    damage = rand.randint(dagger.min_damage, dagger.max_damage)
     damage_bonus = weapon_skill * 0.75 if weapon_skill < 10 else 2.5 + weapon_skill * 0.50
     damage += damage_bonus
     damage -= monster.total_secondary[stat.SecondaryStat.ARMOR]
     damage = max(damage, 0)
     monster.health -= damage
     state.ai_action_points += dagger.action_points_cost
+    state.area.make_noise(*player.position, cp.ATTACK_NOISE_RADIUS)
     state.ui.message(f"TEMP DEBUG: stab {monster.recipe_id} for {damage} damage",
                      msg.Channel.PLAYER_ATTACK)
 
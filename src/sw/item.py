@@ -17,6 +17,8 @@ import sw.const.item as const
 class Item(Entity):
     """ A thing that can be worn, picked up, dropped, used, etc... """
 
+    __slots__ = ("recipe_id", "_alive", "carrying_slot", "cursed", "known_cursed")
+
     def __init__(self, recipe_id):
         super().__init__()
         self.recipe_id = recipe_id
@@ -32,7 +34,9 @@ class Item(Entity):
         return self._alive
 
     def die(self):
-        self._alive = False
+        if self._alive:
+            self._alive = False
+            self.report_death()
 
     def tick(self, state):
         pass
@@ -44,6 +48,8 @@ class Item(Entity):
 class Equipable(Item):
     """ An item that can be equipped. """
 
+    __slots__ = ("wearing_slot",)
+
     def __init__(self, recipe_id):
         super().__init__(recipe_id)
         self.wearing_slot = None
@@ -52,6 +58,9 @@ class Equipable(Item):
 class Weapon(Equipable):
     """ A weapon, either melee or ranged. """
 
+    __slots__ = ("action_points_cost", "armor_penetration", "min_damage", "max_damage",
+                 "to_hit_bonus")
+
     def __init__(self, recipe_id):
         super().__init__(recipe_id)
         self.action_points_cost = None
@@ -64,6 +73,8 @@ class Weapon(Equipable):
 class MeleeWeapon(Weapon):
     """ A generic melee weapon. """
 
+    __slots__ = ()
+
     def __init__(self, recipe_id):
         super().__init__(recipe_id)
         self.wearing_slot = const.EquipmentSlot.MELEE_WEAPON
@@ -72,6 +83,8 @@ class MeleeWeapon(Weapon):
 class RangedWeapon(Weapon):
     """ A generic ranged weapon. """
 
+    __slots__ = ("ammo_types", "range")
+
     def __init__(self, recipe_id):
         super().__init__(recipe_id)
         self.ammo_types = None
@@ -85,6 +98,8 @@ class RangedWeapon(Weapon):
 class Dagger(MeleeWeapon):
     """ A dagger. Gets bonuses to stabbing. """
 
+    __slots__ = ("stab_damage_bonus", "stab_to_hit_bonus")
+
     def __init__(self, recipe_id):
         super().__init__(recipe_id)
         self.stab_damage_bonus = None
@@ -115,6 +130,42 @@ def item_from_recipe(recipe, other_game_data):
         return res
     raise ValueError(f"Unknown item type '{item_type}'")
 
+
+#--------- saving ---------#
+
+
+def item_from_save(save, data):
+    """
+    Create an item from a save.
+
+    :param save: a reader positioned at the item.
+    :type save: sw.save.SaveReader
+    :param data: a game data instance with item prototypes.
+    :type data: sw.gamedata.GameData
+
+    :return: the recreated item.
+    :rtype: Item
+    """
+    res = data.item_prototype_by_id(save.read_id()).clone()
+    res.cursed = save.read_bool()
+    res.known_cursed = save.read_bool()
+    return res
+
+
+def item_to_save(item, save):
+    """
+    Write an item to a save. Only the state that differs between items made
+    from the same recipe is written.
+
+    :param Item item: the item to write.
+    :param save: the writer to write to.
+    :type save: sw.save.SaveWriter
+    """
+    save.write_id(item.recipe_id)
+    save.write_bool(item.cursed)
+    save.write_bool(item.known_cursed)
+
+
 #--------- reading helpers ---------#
 
 
@@ -4,6 +4,10 @@ A module for things that don't fit anywhere else.
 
 
 from collections import deque
+import hashlib
+import logging
+import marshal
+import os
 from pathlib import Path
 import string
 import sys
@@ -13,9 +17,18 @@ import yaml
 
 
 import sw.const.item as item
+import sw.const.misc as constmisc
 from sw.const.misc import INSTALLDIR
 import sw.const.skill as skill
 import sw.const.stat as stat
+from sw.enum_vector import EnumVector
+
+
+# The C loader is much faster, but is only available if PyYAML was built with
+# libyaml
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_LOG = logging.getLogger(__name__)
 
 
 #--------- main things ---------#
@@ -27,8 +40,8 @@ def convert_skill_dict(data):
 
     :param dict data: a dictionary to be converted.
 
-    :return: a dictionary after the conversion.
-    :rtype: dict(sw.const.skill.Skill, int)
+    :return: a vector with skill levels after the conversion.
+    :rtype: sw.enum_vector.EnumVector
     """
     res = empty_skill_dict()
     res.update({skill.Skill(key): value for key, value in data.items()})
@@ -124,21 +137,22 @@ def empty_inventory_dict():
 
 def empty_skill_dict():
     """
-    :return: a dictionary with zeroed skill levels.
-    :rtype: dict(sw.const.skill.Skill, int)
+    :return: a vector with zeroed skill levels.
+    :rtype: sw.enum_vector.EnumVector
     """
-    res = {s: 0 for s in skill.Skill}
+    res = EnumVector(skill.Skill)
     return res
 
 
 def empty_stat_dict():
     """
-    :return: a dictionary with zeroed stat values.
-    :rtype: dict
+    :return: a dictionary with vectors of zeroed stat values for each stat
+    group.
+    :rtype: dict(sw.const.stat.StatGroup, sw.enum_vector.EnumVector)
     """
     res = {}
-    res[stat.StatGroup.PRIMARY] = {s: 0 for s in stat.PrimaryStat}
-    res[stat.StatGroup.SECONDARY] = {s: 0 for s in stat.SecondaryStat}
+    res[stat.StatGroup.PRIMARY] = EnumVector(stat.PrimaryStat)
+    res[stat.StatGroup.SECONDARY] = EnumVector(stat.SecondaryStat)
     return res
 
 
@@ -150,23 +164,22 @@ def read(default, *filename):
     2) ../
     3) /usr/share/severed-world/
 
+    Parsed contents are cached in a compiled form, so unchanged files are not
+    parsed again on the next read.
+
     :param default: a value to return if the requested YAML file is empty.
     :param filename: chunks of the path to a YAML file.
 
     :return: contents of the YAML file.
     :rtype: dict
     """
-    scriptdir = Path(sys.path[0])
     f = Path(*filename)
-    try:
-        return _try_read(scriptdir / f, default=default)
-    except FileNotFoundError:
-        pass
-    try:
-        return _try_read(scriptdir / ".." / f, default=default)
-    except FileNotFoundError:
-        pass
-    return _try_read(Path("/", "usr", "share", INSTALLDIR, f), default=default)
+    for directory in _search_dirs():
+        try:
+            return _try_read(directory / f, default=default)
+        except FileNotFoundError:
+            continue
+    raise FileNotFoundError(f"Cannot find '{f}'")
 
 
 def segment_interpolation(x, *points):
@@ -217,9 +230,55 @@ def slot_stat(slot_type):
 #--------- helper things ---------#
 
 
+def _cache_path(path):
+    """
+    Return the path to the compiled cache of a YAML file.
+
+    :param Path path: the path to the YAML file.
+
+    :return: the path to the cache file.
+    :rtype: Path
+    """
+    base = os.environ.get(constmisc.CACHE_DIR_ENV) or Path.home() / constmisc.DEFAULT_CACHE_DIR
+    key = hashlib.sha1(str(path.resolve()).encode()).hexdigest()
+    # marshal format may change between Python versions
+    version = "".join(map(str, sys.version_info[:2]))
+    return Path(base, INSTALLDIR, f"{key}-py{version}{constmisc.CACHE_FILE_SUFFIX}")
+
+
+def _read_cache(cache_path):
+    """
+    Read a compiled cache file.
+
+    :param Path cache_path: the path to the cache file.
+
+    :return: a dict with 'mtime', 'size', 'hash' and 'data' keys, or None if
+    the cache is missing or broken.
+    :rtype: dict or None
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            res = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(res, dict):
+        return None
+    return res
+
+
+def _search_dirs():
+    """
+    :return: a list of directories to search data files in, in order of
+    preference.
+    :rtype: list[Path]
+    """
+    scriptdir = Path(sys.path[0])
+    return [scriptdir, scriptdir / "..", Path("/", "usr", "share", INSTALLDIR)]
+
+
 def _try_read(path, default=None):
     """
-    Try reading a YAML file.
+    Try reading a YAML file, using its compiled cache if it's up to date.
 
     :param Path path: the path to a file to be read.
     :param default: a value to return if the file is empty.
@@ -227,8 +286,45 @@ def _try_read(path, default=None):
     :return: contents of the YAML file.
     :rtype: dict
     """
-    with open(path) as f:
-        res = yaml.safe_load(f)
-        if res is None:
-            return default
-        return res
+    stat_result = path.stat()
+    cache_path = _cache_path(path)
+    cache = _read_cache(cache_path)
+    if (cache is not None
+            and cache.get("mtime") == stat_result.st_mtime_ns
+            and cache.get("size") == stat_result.st_size):
+        res = cache["data"]
+    else:
+        with open(path, "rb") as f:
+            source = f.read()
+        digest = hashlib.sha256(source).hexdigest()
+        if cache is not None and cache.get("hash") == digest:
+            res = cache["data"]
+        else:
+            res = yaml.load(source, Loader=_YAML_LOADER)
+        _write_cache(cache_path, {
+            "mtime": stat_result.st_mtime_ns,
+            "size": stat_result.st_size,
+            "hash": digest,
+            "data": res,
+            })
+    if res is None:
+        return default
+    return res
+
+
+def _write_cache(cache_path, cache):
+    """
+    Write a compiled cache file, giving up on failure. Failures are logged,
+    as a file that can't be cached is parsed again on every start.
+
+    :param Path cache_path: the path to the cache file.
+    :param dict cache: the contents of the cache.
+    """
+    tmp_path = cache_path.with_suffix(cache_path.suffix + ".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            marshal.dump(cache, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError) as error:
+        _LOG.warning("Could not cache '%s': %s", cache_path, error)
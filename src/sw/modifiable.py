@@ -16,13 +16,25 @@ from sw.stat import HasStats
 class Modifiable(HasSkills, HasStats):
     """
     A class for things that can have modifiers attached to them.
+
+    Total statistics and skills are only recomputed when something they depend
+    on has changed. Modifier deques are kept sorted by priority at all times.
+
+    Expiration and ticking of modifiers, as well as updates of outdated totals,
+    are driven by the modifier schedule of the area the modifiable is in, if
+    any.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         HasSkills.__init__(self)
         HasStats.__init__(self)
         self.innate_modifiers = deque()
         self.temp_modifiers = deque()
+        self.modifier_schedule = None
+        # The number of attached dynamic modifiers
+        self._dynamic_modifiers = 0
 
     #--------- modifiers manipulation ---------#
 
@@ -32,7 +44,12 @@ class Modifiable(HasSkills, HasStats):
 
         :param modifiers: modifiers to be added.
         """
-        self.innate_modifiers.extend(modifiers)
+        for mod in modifiers:
+            _insert_by_priority(self.innate_modifiers, mod)
+            self._dynamic_modifiers += mod.dynamic
+            if self.modifier_schedule is not None:
+                self.modifier_schedule.schedule(self, mod, False)
+        self.invalidate_totals()
 
     def add_temp_modifiers(self, *modifiers):
         """
@@ -40,20 +57,34 @@ class Modifiable(HasSkills, HasStats):
 
         :param modifiers: modifiers to be added.
         """
-        self.temp_modifiers.extend(modifiers)
+        for mod in modifiers:
+            _insert_by_priority(self.temp_modifiers, mod)
+            self._dynamic_modifiers += mod.dynamic
+            if self.modifier_schedule is not None:
+                self.modifier_schedule.schedule(self, mod, True)
+        self.invalidate_totals()
 
     def clear_all_modifiers(self):
         """ Remove all modifiers. """
+        self._unschedule(chain(self.innate_modifiers, self.temp_modifiers))
         self.innate_modifiers = deque()
         self.temp_modifiers = deque()
+        self._dynamic_modifiers = 0
+        self.invalidate_totals()
 
     def clear_innate_modifiers(self):
         """ Remove all innate modifiers. """
+        self._unschedule(self.innate_modifiers)
+        self._dynamic_modifiers -= _count_dynamic(self.innate_modifiers)
         self.innate_modifiers = deque()
+        self.invalidate_totals()
 
     def clear_temp_modifiers(self):
         """ Remove all temporary modifiers. """
+        self._unschedule(self.temp_modifiers)
+        self._dynamic_modifiers -= _count_dynamic(self.temp_modifiers)
         self.temp_modifiers = deque()
+        self.invalidate_totals()
 
     def remove_innate_modifiers(self, *modifiers):
         """
@@ -65,7 +96,10 @@ class Modifiable(HasSkills, HasStats):
             try:
                 self.innate_modifiers.remove(mod)
             except ValueError:
-                pass
+                continue
+            self._dynamic_modifiers -= mod.dynamic
+            self._unschedule((mod,))
+        self.invalidate_totals()
 
     def remove_temp_modifiers(self, *modifiers):
         """
@@ -77,38 +111,102 @@ class Modifiable(HasSkills, HasStats):
             try:
                 self.temp_modifiers.remove(mod)
             except ValueError:
-                pass
+                continue
+            self._dynamic_modifiers -= mod.dynamic
+            self._unschedule((mod,))
+        self.invalidate_totals()
 
     def sort_modifiers(self):
-        """ Sort modifier deques. """
+        """
+        Sort modifier deques. Only needed if modifiers' priorities were changed
+        after they had been attached.
+        """
         self.innate_modifiers = deque(sorted(self.innate_modifiers, key=lambda m: m.priority))
         self.temp_modifiers = deque(sorted(self.temp_modifiers, key=lambda m: m.priority))
+        self.invalidate_totals()
+
+    def _unschedule(self, modifiers):
+        """ Stop tracking given modifiers in the modifier schedule. """
+        if self.modifier_schedule is None:
+            return
+        for mod in modifiers:
+            self.modifier_schedule.unschedule(mod)
 
     #--------- application of modifiers ---------#
 
+    def invalidate_totals(self):
+        """
+        Mark total statistics and skills as outdated, so that they are
+        recomputed on the next update. Must be called after base statistics or
+        skills dicts are changed in place.
+        """
+        self.totals_dirty = True
+        if self.modifier_schedule is not None:
+            self.modifier_schedule.mark_outdated(self)
+
+    def totals_outdated(self):
+        """
+        :return: True if total statistics and skills have to be recomputed,
+        False otherwise.
+        :rtype: bool
+        """
+        return self.totals_dirty or self._dynamic_modifiers > 0
+
     def update_totals(self, state):
         """
-        Update total statistics and skills of the modifiable.
+        Update total statistics and skills of the modifiable, if they are
+        outdated.
 
         :param state: the global game environment modifiers might factor in.
         :type state: sw.gamestate.GameState
         """
-        self.sort_modifiers()
+        if not self.totals_outdated():
+            return
         self._update_skill_totals(state)
         self._update_primary_totals(state)
         self._update_secondary_totals(state)
+        self.totals_dirty = False
 
     def _update_skill_totals(self, state):
-        self.total_skills = self.base_skills.copy()
+        self.total_skills.assign(self.base_skills)
         for mod in chain(self.innate_modifiers, self.temp_modifiers):
             mod.apply_skills(self, state)
 
     def _update_primary_totals(self, state):
-        self.total_primary = self.base_primary.copy()
+        self.total_primary.assign(self.base_primary)
         for mod in chain(self.innate_modifiers, self.temp_modifiers):
             mod.apply_primary(self, state)
 
     def _update_secondary_totals(self, state):
-        self.total_secondary = self.base_secondary.copy()
+        self.total_secondary.assign(self.base_secondary)
         for mod in chain(self.innate_modifiers, self.temp_modifiers):
             mod.apply_secondary(self, state)
+
+
+#--------- helper things ---------#
+
+
+def _count_dynamic(modifiers):
+    """
+    :param modifiers: modifiers to count.
+    :type modifiers: iter[sw.modifier.Modifier]
+
+    :return: the number of dynamic modifiers among given ones.
+    :rtype: int
+    """
+    return sum(1 for mod in modifiers if mod.dynamic)
+
+
+def _insert_by_priority(modifiers, mod):
+    """
+    Insert a modifier into a deque sorted by priority, after all modifiers
+    with the same priority.
+
+    :param deque modifiers: the sorted deque.
+    :param mod: the modifier to insert.
+    :type mod: sw.modifier.Modifier
+    """
+    index = len(modifiers)
+    while index > 0 and modifiers[index - 1].priority > mod.priority:
+        index -= 1
+    modifiers.insert(index, mod)
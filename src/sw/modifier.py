@@ -8,6 +8,9 @@ The class is supposed to be subclassed.
 """
 
 
+from copy import copy
+
+
 import sw.const.message as msg
 import sw.const.modifier as mod
 import sw.const.skill as skill
@@ -29,6 +32,32 @@ class Modifier():
         self.duration = 0
         self.priority = 0
         self.tick_message = None
+        # Dynamic modifiers depend on the game state, so totals of whatever
+        # they are attached to are recomputed every turn. Must not change
+        # while the modifier is attached
+        self.dynamic = False
+        # The turn this modifier expires at, set while it is tracked by a
+        # sw.modifier_schedule.ModifierSchedule
+        self.expires_at = None
+
+    def clone(self):
+        """
+        Create a copy of this modifier to attach it to something.
+
+        :return: the copy.
+        :rtype: Modifier
+        """
+        res = copy(self)
+        res.expires_at = None
+        return res
+
+    def has_tick_effects(self):
+        """
+        :return: True if the modifier does something every turn, False if it
+        can be left alone until it expires.
+        :rtype: bool
+        """
+        return self.tick_message is not None or type(self).tick is not Modifier.tick
 
     def apply_skills(self, attached_to, state):
         """
@@ -68,8 +97,14 @@ class Modifier():
         pass
 
     def tick(self, attached_to, state):
-        """ Apply periodic changes to the 'attached_to' modifiable. """
-        pass
+        """
+        Apply periodic changes to the 'attached_to' modifiable.
+
+        Subclasses overriding this are ticked every turn, others only if they
+        have a tick message.
+        """
+        if self.tick_message is not None:
+            state.ui.message(self.tick_message, msg.Channel.MODIFIER_TICK)
 
 
 #--------- creating modifiers from recipes  ---------#
@@ -91,8 +126,83 @@ def modifier_from_recipe(recipe, other_data):
 
 
 def modifier_from_save(save, data):
-    """ Create a modifier from a save. """
-    raise NotImplementedError
+    """
+    Create a modifier from a save.
+
+    :param save: a reader positioned at the modifier.
+    :type save: sw.save.SaveReader
+    :param data: game data.
+    :type data: sw.gamedata.GameData
+
+    :return: the recreated modifier.
+    :rtype: Modifier
+    """
+    cls = save.read_enum(mod.ModifierType)
+    recipe_id = save.read_id()
+    if cls == mod.ModifierType.FLAT_STAT_INCREASE:
+        res = FlatStatIncrease(recipe_id)
+        _read_common_fields_from_save(res, save)
+        _read_flat_increase_fields_from_save(res, save)
+        return res
+    raise ValueError(f"Unknown modifier type '{cls}'")
+
+
+def modifiers_from_save(save, data):
+    """
+    Create a sequence of modifiers written by 'modifiers_to_save'.
+
+    :param save: a reader positioned at the modifiers.
+    :type save: sw.save.SaveReader
+    :param data: game data.
+    :type data: sw.gamedata.GameData
+
+    :return: the recreated modifiers.
+    :rtype: list[Modifier]
+    """
+    return [modifier_from_save(save, data) for _ in range(save.read_uint())]
+
+
+#--------- writing modifiers to saves ---------#
+
+
+def modifier_to_save(modifier, save, duration):
+    """
+    Write a modifier to a save.
+
+    :param Modifier modifier: the modifier to write.
+    :param save: the writer to write to.
+    :type save: sw.save.SaveWriter
+    :param int duration: the remaining duration of the modifier.
+    """
+    if isinstance(modifier, FlatStatIncrease):
+        save.write_enum(mod.ModifierType.FLAT_STAT_INCREASE)
+        save.write_id(modifier.recipe_id)
+        _write_common_fields_to_save(modifier, save, duration)
+        _write_flat_increase_fields_to_save(modifier, save)
+        return
+    raise ValueError(f"Can't save modifier of type '{type(modifier).__name__}'")
+
+
+def modifiers_to_save(modifiers, save, schedule=None):
+    """
+    Write a sequence of modifiers to a save.
+
+    :param modifiers: the modifiers to write.
+    :type modifiers: iter[Modifier]
+    :param save: the writer to write to.
+    :type save: sw.save.SaveWriter
+    :param schedule: the schedule tracking the modifiers, if any. Remaining
+    durations are taken from it.
+    :type schedule: sw.modifier_schedule.ModifierSchedule or None
+    """
+    modifiers = list(modifiers)
+    save.write_uint(len(modifiers))
+    for modifier in modifiers:
+        if schedule is None:
+            duration = modifier.duration
+        else:
+            duration = schedule.remaining_duration(modifier)
+        modifier_to_save(modifier, save, duration)
 
 
 #--------- subclasses ---------#
@@ -115,12 +225,6 @@ class FlatStatIncrease(Modifier):
         if self.which_group == stat.StatGroup.SECONDARY:
             attached_to.total_secondary[self.which] += self.amount
 
-    def tick(self, attached_to, state):
-        if self.duration > 0:
-            self.duration -= 1
-        if self.tick_message is not None:
-            state.ui.message(self.tick_message, msg.Channel.MODIFIER_TICK)
-
 
 #--------- helper things ---------#
 
@@ -153,3 +257,40 @@ def _read_flat_increase_fields_from_recipe(modifier, recipe):
     except ValueError:
         pass
     raise ValueError(f"Unknown statistics '{which}'")
+
+
+def _read_common_fields_from_save(modifier, save):
+    """ Read common fields from the save into the modifier. """
+    modifier.attach_message = save.read_id()
+    modifier.dissipate_message = save.read_id()
+    modifier.tick_message = save.read_id()
+    modifier.duration = save.read_int()
+    modifier.priority = save.read_int()
+    modifier.dynamic = save.read_bool()
+
+
+def _read_flat_increase_fields_from_save(modifier, save):
+    """ Read FlatStatIncrease fields from the save into the modifier. """
+    modifier.amount = save.read_number()
+    modifier.which_group = save.read_enum(stat.StatGroup)
+    if modifier.which_group == stat.StatGroup.PRIMARY:
+        modifier.which = save.read_enum(stat.PrimaryStat)
+    else:
+        modifier.which = save.read_enum(stat.SecondaryStat)
+
+
+def _write_common_fields_to_save(modifier, save, duration):
+    """ Write common fields of the modifier to the save. """
+    save.write_id(modifier.attach_message)
+    save.write_id(modifier.dissipate_message)
+    save.write_id(modifier.tick_message)
+    save.write_int(duration)
+    save.write_int(modifier.priority)
+    save.write_bool(modifier.dynamic)
+
+
+def _write_flat_increase_fields_to_save(modifier, save):
+    """ Write FlatStatIncrease fields of the modifier to the save. """
+    save.write_number(modifier.amount)
+    save.write_enum(modifier.which_group)
+    save.write_enum(modifier.which)
@@ -0,0 +1,158 @@
+"""
+Modifier schedule module.
+
+Provides ModifierSchedule class used to expire and tick temporary modifiers
+and to keep total statistics up to date without walking every modifier of
+every character each turn.
+"""
+
+
+import heapq
+
+
+class ModifierSchedule():
+    """
+    A queue of modifier expirations keyed by the turn they happen at, along
+    with the set of modifiers that have to be ticked every turn.
+
+    Modifiers without tick effects are not touched at all until they expire.
+    Entries for modifiers removed before their expiration are left in the
+    queue and skipped when popped.
+
+    Totals are recomputed at the end of a turn only for modifiables which were
+    marked as outdated or have dynamic modifiers attached.
+    """
+
+    def __init__(self):
+        self.turn = 0
+        self.expirations = []
+        self.ticking = {}
+        self.dynamic = {}
+        # Modifiables with outdated totals, the dict is used as an ordered set
+        self.outdated = {}
+        # Tie breaker for expirations at the same turn
+        self._sequence = 0
+
+    #--------- registration ---------#
+
+    def adopt(self, modifiable):
+        """
+        Schedule all modifiers of a modifiable, taking it over from another
+        schedule if needed.
+
+        :param modifiable: the thing whose modifiers are to be scheduled.
+        :type modifiable: sw.modifiable.Modifiable
+        """
+        if modifiable.modifier_schedule is self:
+            return
+        if modifiable.modifier_schedule is not None:
+            modifiable.modifier_schedule.release(modifiable)
+        modifiable.modifier_schedule = self
+        for mod in modifiable.innate_modifiers:
+            self.schedule(modifiable, mod, False)
+        for mod in modifiable.temp_modifiers:
+            self.schedule(modifiable, mod, True)
+        if modifiable.totals_dirty:
+            self.mark_outdated(modifiable)
+
+    def release(self, modifiable):
+        """
+        Stop tracking modifiers of a modifiable. Remaining durations of its
+        temporary modifiers are written back into them.
+
+        :param modifiable: the thing whose modifiers are to be unscheduled.
+        :type modifiable: sw.modifiable.Modifiable
+        """
+        for mod in modifiable.innate_modifiers:
+            self.unschedule(mod)
+        for mod in modifiable.temp_modifiers:
+            mod.duration = self.remaining_duration(mod)
+            self.unschedule(mod)
+        self.outdated.pop(modifiable, None)
+        modifiable.modifier_schedule = None
+
+    def mark_outdated(self, modifiable):
+        """
+        Recompute totals of a modifiable at the end of the current turn.
+
+        :param modifiable: the thing whose totals are outdated.
+        :type modifiable: sw.modifiable.Modifiable
+        """
+        self.outdated[modifiable] = None
+
+    def schedule(self, modifiable, mod, temporary):
+        """
+        Start tracking a single modifier.
+
+        :param modifiable: the thing the modifier is attached to.
+        :type modifiable: sw.modifiable.Modifiable
+        :param mod: the modifier.
+        :type mod: sw.modifier.Modifier
+        :param bool temporary: whether the modifier can expire.
+        """
+        if mod.has_tick_effects():
+            self.ticking[mod] = modifiable
+        if mod.dynamic:
+            self.dynamic[mod] = modifiable
+        if temporary and mod.duration >= 0:
+            mod.expires_at = self.turn + mod.duration
+            self._sequence += 1
+            heapq.heappush(self.expirations,
+                           (mod.expires_at, self._sequence, modifiable, mod))
+
+    def unschedule(self, mod):
+        """
+        Stop tracking a single modifier.
+
+        :param mod: the modifier.
+        :type mod: sw.modifier.Modifier
+        """
+        self.ticking.pop(mod, None)
+        self.dynamic.pop(mod, None)
+        mod.expires_at = None
+
+    def remaining_duration(self, mod):
+        """
+        :param mod: a modifier tracked by this schedule.
+        :type mod: sw.modifier.Modifier
+
+        :return: the number of turns until the modifier expires or its own
+        duration if it never does.
+        :rtype: int
+        """
+        if mod.expires_at is None:
+            return mod.duration
+        return max(mod.expires_at - self.turn, 0)
+
+    #--------- game logic ---------#
+
+    def advance(self, state):
+        """
+        Process a single game turn: tick modifiers with tick effects, expire
+        modifiers whose time has come and update outdated totals.
+
+        :param state: the global state of the game.
+        :type state: sw.gamestate.GameState
+        """
+        self.turn += 1
+        for mod, modifiable in list(self.ticking.items()):
+            if modifiable.alive():
+                mod.tick(modifiable, state)
+        expirations = self.expirations
+        while expirations and expirations[0][0] <= self.turn:
+            expires_at, _, modifiable, mod = heapq.heappop(expirations)
+            if mod.expires_at != expires_at or modifiable.modifier_schedule is not self:
+                continue
+            self.unschedule(mod)
+            mod.duration = 0
+            if mod not in modifiable.temp_modifiers:
+                continue
+            modifiable.remove_temp_modifiers(mod)
+            mod.expire(modifiable, state)
+        outdated = self.outdated
+        self.outdated = {}
+        for modifiable in self.dynamic.values():
+            outdated[modifiable] = None
+        for modifiable in outdated:
+            if modifiable.alive():
+                modifiable.update_totals(state)
@@ -8,11 +8,10 @@ Provides base Monster class and several subclasses.
 import random as rand
 
 
-from sw.character import Character
+from sw.character import Character, read_character_state, write_character_state
 from sw.const.message import Channel
 import sw.const.ai as aiconst
 import sw.const.entity as entconst
-import sw.const.visibility as visconst
 import sw.const.monster as const
 import sw.const.strings as conststr
 import sw.misc as misc
@@ -24,6 +23,9 @@ import sw.misc as misc
 class Monster(Character):
     """ A monster or some other NPC. """
 
+    __slots__ = ("recipe_id", "action_points", "ai", "death_message", "do_award_xp",
+                 "xp_award", "turn_scheduler")
+
     def __init__(self, recipe_id):
         """
         Initialize a monster.
@@ -38,14 +40,22 @@ class Monster(Character):
         self.death_message = None
         self.do_award_xp = True
         self.xp_award = 0
+        self.turn_scheduler = None
         self.add_blocked_by(entconst.CollisionGroup.CHARACTER)
         self.add_blocks(entconst.CollisionGroup.CHARACTER)
 
     #--------- stuff inherited from Entity ---------#
 
+    def clone(self):
+        res = super().clone()
+        res.action_points = 0
+        res.turn_scheduler = None
+        # AI state is per monster, so the clone starts with a fresh one
+        res.ai = None if self.ai is None else type(self.ai)()
+        return res
+
     def death_action(self, state):
-        visinfo = state.area.visibility_matrix[self.position]
-        visible = visconst.VisibilityLevel.VISIBLE in visinfo.levels
+        visible = state.area.visibility_matrix.visible(*self.position)
         if self.do_award_xp:
             state.player.xp += self.xp_award
         if visible:
@@ -57,9 +67,35 @@ class Monster(Character):
 
     #--------- other logic ---------#
 
-    def alarm(self):
-        """ Raise the AI 'alarmed' flag. """
+    def alarm(self, coordinates=None):
+        """
+        Raise the AI 'alarmed' flag and wake the monster up.
+
+        :param coordinates: the position of the cause of the alarm, if known.
+        :type coordinates: tuple(int, int) or None
+        """
         self.ai.alarmed = True
+        if coordinates is not None:
+            self.ai.alarm_coordinates = coordinates
+        self.wake_up()
+
+    def dormant(self):
+        """
+        :return: True if the monster is asleep and gets no turns, False
+        otherwise.
+        :rtype: bool
+        """
+        return self.turn_scheduler is not None and self in self.turn_scheduler.suspended
+
+    def fall_dormant(self):
+        """ Stop getting turns until woken up. """
+        if self.turn_scheduler is not None:
+            self.turn_scheduler.suspend(self)
+
+    def wake_up(self):
+        """ Start getting turns again if dormant. """
+        if self.turn_scheduler is not None:
+            self.turn_scheduler.resume(self)
 
 
 #--------- subclasses ---------#
@@ -70,6 +106,8 @@ class GenericMonster(Monster):
     A generic monster with no special attributes or behaviour.
     """
 
+    __slots__ = ()
+
     def __init__(self, recipe_id):
         super().__init__(recipe_id)
         self.add_blocked_by(entconst.CollisionGroup.WALL)
@@ -101,16 +139,45 @@ def monster_from_recipe(recipe, other_game_data):
 #--------- monster creation from saves ---------#
 
 
-def monster_from_save(save):
+def monster_from_save(save, data):
     """
     Create a monster from a save.
 
-    :param dict save: a dictionary with the info about a saved monster.
+    :param save: a reader positioned at the monster.
+    :type save: sw.save.SaveReader
+    :param data: game data with monster prototypes.
+    :type data: sw.gamedata.GameData
 
     :return: a regenerated monster
     :rtype: Monster
     """
-    raise NotImplementedError
+    res = data.monster_prototype_by_id(save.read_id()).clone()
+    read_character_state(res, save, data)
+    res.action_points = save.read_number()
+    res.do_award_xp = save.read_bool()
+    res.ai.alarmed = save.read_bool()
+    res.ai.alarm_coordinates = save.read_position()
+    return res
+
+
+#--------- writing monsters to saves ---------#
+
+
+def monster_to_save(monster, save):
+    """
+    Write a monster to a save. Things that come from the monster's recipe,
+    like its statistics and innate modifiers, are not written.
+
+    :param Monster monster: the monster to write.
+    :param save: the writer to write to.
+    :type save: sw.save.SaveWriter
+    """
+    save.write_id(monster.recipe_id)
+    write_character_state(monster, save)
+    save.write_number(monster.action_points)
+    save.write_bool(monster.do_award_xp)
+    save.write_bool(monster.ai.alarmed)
+    save.write_position(monster.ai.alarm_coordinates)
 
 
 #--------- helper things ---------#
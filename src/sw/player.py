@@ -9,12 +9,16 @@ from copy import deepcopy
 
 
 from sw.const.entity import CollisionGroup
-from sw.character import Character
+import sw.const.stat as stat
+from sw.character import Character, read_character_state, write_character_state
+from sw.modifier import modifiers_from_save, modifiers_to_save
 
 
 class Player(Character):
     """ Player character. """
 
+    __slots__ = ("name", "species", "background", "xp")
+
     def __init__(self):
         super().__init__()
         self.name = None
@@ -37,16 +41,51 @@ class Player(Character):
 #--------- generating a player from a saved dict ---------#
 
 
-def player_from_save(save):
+def player_from_save(save, data):
     """
     Generate a player from a save.
 
-    :param dict save: info used to regenerate the player.
+    :param save: a reader positioned at the player.
+    :type save: sw.save.SaveReader
+    :param data: game data with species, backgrounds and item prototypes.
+    :type data: sw.gamedata.GameData
 
     :return: a regenerated Player object.
     :rtype: Player
     """
-    raise NotImplementedError
+    res = Player()
+    res.name = save.read_str()
+    res.species = _by_id(data.species, save.read_id(), "species")
+    res.background = _by_id(data.backgrounds, save.read_id(), "background")
+    res.xp = save.read_number()
+    for group in stat.StatGroup:
+        save.read_vector(res.base_stats[group])
+    save.read_vector(res.base_skills)
+    res.add_innate_modifiers(*modifiers_from_save(save, data))
+    read_character_state(res, save, data)
+    return res
+
+
+#--------- writing a player to a save ---------#
+
+
+def player_to_save(player, save):
+    """
+    Write a player to a save.
+
+    :param Player player: the player to write.
+    :param save: the writer to write to.
+    :type save: sw.save.SaveWriter
+    """
+    save.write_str(player.name)
+    save.write_id(player.species.id)
+    save.write_id(player.background.id)
+    save.write_number(player.xp)
+    for group in stat.StatGroup:
+        save.write_vector(player.base_stats[group])
+    save.write_vector(player.base_skills)
+    modifiers_to_save(player.innate_modifiers, save)
+    write_character_state(player, save)
 
 
 #--------- generating a player from scratch ---------#
@@ -82,7 +121,7 @@ def _apply_species(player):
     """
     player.base_stats = deepcopy(player.species.base_stats)
     player.equipment = deepcopy(player.species.slots)
-    player.add_innate_modifiers(*deepcopy(player.species.modifiers))
+    player.add_innate_modifiers(*(mod.clone() for mod in player.species.modifiers))
 
 def _apply_background(player):
     """
@@ -91,4 +130,19 @@ def _apply_background(player):
     :param player: a player to apply the background's modifiers to.
     :type player: Player
     """
-    player.add_temp_modifiers(*deepcopy(player.background.modifiers))
+    player.add_temp_modifiers(*(mod.clone() for mod in player.background.modifiers))
+
+def _by_id(things, thing_id, kind):
+    """
+    Find a species or a background by its ID.
+
+    :param list things: the list to search.
+    :param str thing_id: the ID to look for.
+    :param str kind: the kind of the things, used in the error message.
+
+    :raises ValueError: if there's no thing with the ID.
+    """
+    for thing in things:
+        if thing.id == thing_id:
+            return thing
+    raise ValueError(f"Unknown {kind} ID '{thing_id}'")
@@ -0,0 +1,338 @@
+"""
+Save module.
+
+Provides SaveWriter and SaveReader classes used to write game objects to and
+read them from the binary save format.
+
+A save file starts with a header holding the version of the format and the
+kind of the record stored in the file. The record is a plain sequence of
+fields with no names or framing, read back in the same order it was written:
+integers are variable-length, floats are little-endian doubles, strings are
+UTF-8 prefixed with their length. Recipe IDs and other strings repeated many
+times are interned: such a string is written in full only where it occurs
+first, later occurrences are written as small indices.
+"""
+
+
+from array import array
+import os
+import struct
+import sys
+
+
+import sw.const.save as const
+
+
+_HEADER = struct.Struct(f"<{len(const.MAGIC)}sHB")
+_DOUBLE = struct.Struct("<d")
+
+# Tags of numbers written with write_number
+_INT_TAG = 0
+_FLOAT_TAG = 1
+
+
+#--------- writing ---------#
+
+
+class SaveWriter():
+    """ A buffer game objects are written to field by field. """
+
+    def __init__(self, kind):
+        """
+        Initialize a writer and write the save header into it.
+
+        :param kind: the kind of the record that will be written.
+        :type kind: sw.const.save.RecordKind
+        """
+        self.buffer = bytearray(_HEADER.pack(const.MAGIC, const.VERSION, kind.value))
+        self.interned = {}
+
+    def dump(self, path):
+        """
+        Write the buffer to a file. The file is replaced only after the write
+        succeeds, so a failed save doesn't destroy the previous one.
+
+        :param str path: the path to the file.
+        """
+        temp_path = path + const.TEMP_SUFFIX
+        with open(temp_path, "wb") as file:
+            file.write(self.buffer)
+        os.replace(temp_path, path)
+
+    #--------- primitives ---------#
+
+    def write_bool(self, value):
+        """ :param bool value: the value to write. """
+        self.buffer.append(1 if value else 0)
+
+    def write_bytes(self, value):
+        """ :param bytes value: the bytes to write. """
+        self.write_uint(len(value))
+        self.buffer += value
+
+    def write_float(self, value):
+        """ :param float value: the value to write. """
+        self.buffer += _DOUBLE.pack(value)
+
+    def write_int(self, value):
+        """ :param int value: the value to write. """
+        self.write_uint(value << 1 if value >= 0 else (-value << 1) - 1)
+
+    def write_number(self, value):
+        """
+        Write a number, preserving whether it's an int or a float.
+
+        :param value: the value to write.
+        :type value: int or float
+        """
+        if isinstance(value, int):
+            self.buffer.append(_INT_TAG)
+            self.write_int(value)
+        else:
+            self.buffer.append(_FLOAT_TAG)
+            self.write_float(value)
+
+    def write_str(self, value):
+        """ :param str value: the value to write. """
+        self.write_bytes(value.encode())
+
+    def write_uint(self, value):
+        """ :param int value: the value to write, must not be negative. """
+        buffer = self.buffer
+        while value > 0x7f:
+            buffer.append((value & 0x7f) | 0x80)
+            value >>= 7
+        buffer.append(value)
+
+    #--------- compound values ---------#
+
+    def write_enum(self, member):
+        """
+        :param member: the enum member to write. Members are written by name,
+        so they survive reordering of the enum.
+        :type member: enum.Enum
+        """
+        self.write_id(member.name)
+
+    def write_id(self, value):
+        """
+        Write an interned string, such as a recipe ID.
+
+        :param value: the string to write.
+        :type value: str or None
+        """
+        if value is None:
+            self.write_uint(0)
+            return
+        index = self.interned.get(value)
+        if index is not None:
+            self.write_uint(index)
+            return
+        index = len(self.interned) + 1
+        self.interned[value] = index
+        self.write_uint(index)
+        self.write_str(value)
+
+    def write_optional_uint(self, value):
+        """
+        :param value: the value to write.
+        :type value: int or None
+        """
+        self.write_uint(0 if value is None else value + 1)
+
+    def write_position(self, position):
+        """
+        :param position: the position to write.
+        :type position: tuple(int, int) or None
+        """
+        self.write_bool(position is not None)
+        if position is not None:
+            self.write_int(position[0])
+            self.write_int(position[1])
+
+    def write_positions(self, positions):
+        """
+        Write a sequence of positions as a packed array of coordinates.
+
+        :param positions: the positions to write.
+        :type positions: list[tuple(int, int)]
+        """
+        coords = array("i")
+        for x, y in positions:
+            coords.append(x)
+            coords.append(y)
+        if sys.byteorder == "big":
+            coords.byteswap()
+        self.write_uint(len(positions))
+        self.buffer += coords.tobytes()
+
+    def write_vector(self, vector):
+        """
+        :param vector: the vector to write.
+        :type vector: sw.enum_vector.EnumVector
+        """
+        self.write_uint(len(vector))
+        for value in vector.values():
+            self.write_number(value)
+
+
+#--------- reading ---------#
+
+
+class SaveReader():
+    """ A cursor over a save, reading game objects field by field. """
+
+    def __init__(self, data, kind):
+        """
+        Initialize a reader and check the save header.
+
+        :param bytes data: the contents of the save.
+        :param kind: the kind of the record expected in the save.
+        :type kind: sw.const.save.RecordKind
+
+        :raises ValueError: if the data is not a save, is a save of an
+        unsupported version or contains a record of a different kind.
+        """
+        self.data = data
+        self.offset = _HEADER.size
+        self.interned = []
+        try:
+            magic, version, kind_value = _HEADER.unpack_from(data)
+        except struct.error:
+            raise ValueError("Not a save file") from None
+        if magic != const.MAGIC:
+            raise ValueError("Not a save file")
+        if version != const.VERSION:
+            raise ValueError(f"Unsupported save version {version}")
+        if kind_value != kind.value:
+            raise ValueError(f"Expected a save of kind '{kind.name}'")
+
+    #--------- primitives ---------#
+
+    def read_bool(self):
+        """ :rtype: bool """
+        res = self.data[self.offset] != 0
+        self.offset += 1
+        return res
+
+    def read_bytes(self):
+        """ :rtype: bytes """
+        size = self.read_uint()
+        start = self.offset
+        self.offset += size
+        return self.data[start:self.offset]
+
+    def read_float(self):
+        """ :rtype: float """
+        res, = _DOUBLE.unpack_from(self.data, self.offset)
+        self.offset += _DOUBLE.size
+        return res
+
+    def read_int(self):
+        """ :rtype: int """
+        value = self.read_uint()
+        return -((value + 1) >> 1) if value & 1 else value >> 1
+
+    def read_number(self):
+        """ :rtype: int or float """
+        tag = self.data[self.offset]
+        self.offset += 1
+        if tag == _INT_TAG:
+            return self.read_int()
+        return self.read_float()
+
+    def read_str(self):
+        """ :rtype: str """
+        return self.read_bytes().decode()
+
+    def read_uint(self):
+        """ :rtype: int """
+        data = self.data
+        offset = self.offset
+        res = 0
+        shift = 0
+        byte = data[offset]
+        while byte & 0x80:
+            res |= (byte & 0x7f) << shift
+            shift += 7
+            offset += 1
+            byte = data[offset]
+        self.offset = offset + 1
+        return res | (byte << shift)
+
+    #--------- compound values ---------#
+
+    def read_enum(self, enum_class):
+        """
+        :param type enum_class: the enum the member belongs to.
+
+        :rtype: enum.Enum
+        """
+        return enum_class[self.read_id()]
+
+    def read_id(self):
+        """ :rtype: str or None """
+        index = self.read_uint()
+        if index == 0:
+            return None
+        if index > len(self.interned):
+            self.interned.append(self.read_str())
+        return self.interned[index - 1]
+
+    def read_optional_uint(self):
+        """ :rtype: int or None """
+        value = self.read_uint()
+        return None if value == 0 else value - 1
+
+    def read_position(self):
+        """ :rtype: tuple(int, int) or None """
+        if not self.read_bool():
+            return None
+        x = self.read_int()
+        return (x, self.read_int())
+
+    def read_positions(self):
+        """ :rtype: list[tuple(int, int)] """
+        count = self.read_uint()
+        coords = array("i")
+        start = self.offset
+        self.offset += 2 * count * coords.itemsize
+        coords.frombytes(self.data[start:self.offset])
+        if sys.byteorder == "big":
+            coords.byteswap()
+        return list(zip(coords[::2], coords[1::2]))
+
+    def read_vector(self, vector):
+        """
+        Read values into a vector.
+
+        :param vector: the vector to read into.
+        :type vector: sw.enum_vector.EnumVector
+
+        :raises ValueError: if the saved vector has a different size.
+        """
+        if self.read_uint() != len(vector):
+            raise ValueError(f"Saved vector doesn't match {vector.enum_class.__name__}")
+        for key in vector:
+            vector[key] = self.read_number()
+
+
+#--------- files ---------#
+
+
+def open_save(path, kind):
+    """
+    Read a save file.
+
+    :param str path: the path to the file.
+    :param kind: the kind of the record expected in the file.
+    :type kind: sw.const.save.RecordKind
+
+    :return: a reader positioned at the start of the record.
+    :rtype: SaveReader
+
+    :raises ValueError: if the file is not a save of the expected kind and
+    version.
+    """
+    with open(path, "rb") as file:
+        return SaveReader(file.read(), kind)
@@ -11,10 +11,32 @@ from sw.misc import empty_skill_dict
 class HasSkills():
     """ A thing that can have skills. """
 
+    __slots__ = ()
+
     def __init__(self):
-        self.base_skills = empty_skill_dict()
+        self.totals_dirty = True
+        self._base_skills = empty_skill_dict()
         self.total_skills = empty_skill_dict()
 
+    @property
+    def base_skills(self):
+        """
+        :return: base skill levels.
+        :rtype: sw.enum_vector.EnumVector
+        """
+        return self._base_skills
+
+    @base_skills.setter
+    def base_skills(self, new):
+        """
+        Set base skill levels.
+
+        :param new: new vector with base skill levels.
+        :type new: sw.enum_vector.EnumVector
+        """
+        self._base_skills = new
+        self.invalidate_totals()
+
     def upgrade_skill(self, which):
         """
         Increase a skill's level by one.
@@ -23,3 +45,8 @@ class HasSkills():
         :type which: sw.const.skill.Skill
         """
         self.base_skills[which] += 1
+        self.invalidate_totals()
+
+    def invalidate_totals(self):
+        """ Mark total skills as outdated. """
+        self.totals_dirty = True
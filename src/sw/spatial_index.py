@@ -0,0 +1,157 @@
+"""
+Spatial index module.
+
+Provides SpatialIndex class used to look up entities by their position.
+"""
+
+
+class SpatialIndex():
+    """
+    A mapping from positions to the entities occupying them.
+
+    Entities registered in an index report their own movement to it, so the
+    index stays up to date no matter how the position of an entity is changed.
+    Hidden entities are not present in the index until they are placed again.
+
+    For every occupied position the index also keeps the union of collision
+    groups blocked by the entities there, so that a position can be checked
+    for blockers without looking at the entities themselves.
+    """
+
+    def __init__(self):
+        self.cells = {}
+        self.masks = {}
+
+    def add(self, entity):
+        """
+        Register an entity in the index.
+
+        :param entity: the entity to be registered.
+        :type entity: sw.entity.Entity
+        """
+        entity.spatial_index = self
+        if entity.position is not None:
+            self._insert(entity, entity.position)
+
+    def at(self, x, y):
+        """
+        Return all entities at a given position, both alive and dead.
+
+        The returned sequence belongs to the index and must not be modified.
+
+        :param int x: the X coordinate of the position.
+        :param int y: the Y coordinate of the position.
+
+        :return: a sequence of entities at the given position.
+        :rtype: list[sw.entity.Entity] or tuple
+        """
+        return self.cells.get((x, y), ())
+
+    def near(self, x, y, radius):
+        """
+        Return all entities within a given distance (in Chebyshev metric) from
+        a position, both alive and dead.
+
+        :param int x: the X coordinate of the position.
+        :param int y: the Y coordinate of the position.
+        :param int radius: the maximum distance.
+
+        :return: a list of entities.
+        :rtype: list[sw.entity.Entity]
+        """
+        res = []
+        if (2 * radius + 1) ** 2 < len(self.cells):
+            for cell_x in range(x - radius, x + radius + 1):
+                for cell_y in range(y - radius, y + radius + 1):
+                    res.extend(self.cells.get((cell_x, cell_y), ()))
+            return res
+        for (cell_x, cell_y), cell in self.cells.items():
+            if abs(cell_x - x) <= radius and abs(cell_y - y) <= radius:
+                res.extend(cell)
+        return res
+
+    def mask_at(self, x, y):
+        """
+        Return the union of collision groups blocked by entities at a given
+        position, both alive and dead.
+
+        :param int x: the X coordinate of the position.
+        :param int y: the Y coordinate of the position.
+
+        :return: a bitmask of collision groups.
+        :rtype: int
+        """
+        return self.masks.get((x, y), 0)
+
+    def move(self, entity, old_position, new_position):
+        """
+        Update the index after an entity has changed its position.
+
+        :param entity: the entity that has moved.
+        :type entity: sw.entity.Entity
+        :param old_position: the previous position of the entity or None if it
+        was hidden.
+        :type old_position: tuple(int, int) or None
+        :param new_position: the current position of the entity or None if it
+        was hidden.
+        :type new_position: tuple(int, int) or None
+        """
+        if old_position is not None:
+            self._discard(entity, old_position)
+        if new_position is not None:
+            self._insert(entity, new_position)
+
+    def remove(self, entity):
+        """
+        Unregister an entity from the index.
+
+        :param entity: the entity to be unregistered.
+        :type entity: sw.entity.Entity
+        """
+        if entity.position is not None:
+            self._discard(entity, entity.position)
+        entity.spatial_index = None
+
+    def refresh_mask(self, position):
+        """
+        Recompute the collision mask of a position. Needed only if collision
+        groups of an entity change while it's in the index.
+
+        :param position: the position to recompute the mask of.
+        :type position: tuple(int, int)
+        """
+        cell = self.cells.get(position)
+        if not cell:
+            self.masks.pop(position, None)
+            return
+        mask = 0
+        for entity in cell:
+            mask |= entity.blocks_mask
+        self.masks[position] = mask
+
+    #--------- helper things ---------#
+
+    def _discard(self, entity, position):
+        """ Remove an entity from the cell at a given position. """
+        cell = self.cells.get(position)
+        if cell is None:
+            return
+        try:
+            cell.remove(entity)
+        except ValueError:
+            return
+        if not cell:
+            del self.cells[position]
+            del self.masks[position]
+        elif entity.blocks_mask:
+            self.refresh_mask(position)
+
+    def _insert(self, entity, position):
+        """ Add an entity to the cell at a given position. """
+        cell = self.cells.get(position)
+        if cell is None:
+            self.cells[position] = [entity]
+            self.masks[position] = entity.blocks_mask
+        else:
+            cell.append(entity)
+            self.masks[position] |= entity.blocks_mask
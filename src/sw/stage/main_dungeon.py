@@ -51,17 +51,14 @@ class MainDungeon(flow.SWFlow):
         self.state.area.tick(self.state)
         self.state.player.tick(self.state)
         # TEMP DEBUG
-        import sw.item as item
-        import sw.monster as monster
         self.state.area.randomly_place_player(self.state.player)
         self.state.area.update_visibility_matrix()
-        recipe = self.state.data.monster_recipe_by_id("debug melee zombie")
-        mon = monster.monster_from_recipe(recipe, self.state.data)
+        mon = self.state.data.monster_prototype_by_id("debug melee zombie").clone()
         mon.tick(self.state)
         mon.health = 1
-        item_recipe = self.state.data.item_recipe_by_id("debug dagger")
+        item_prototype = self.state.data.item_prototype_by_id("debug dagger")
         for i in range(80):
-            dagger = item.item_from_recipe(item_recipe, self.state.data)
+            dagger = item_prototype.clone()
             ii.pick_up_item(dagger, self.state.player, self.state, False)
         self.mon = mon
         self.state.area.add_entity(mon, 3, 3)
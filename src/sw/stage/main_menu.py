@@ -30,5 +30,5 @@ class MainMenu(flow.SWFlow):
         if ev[0] != event.QUIT:
             return False
         import sw.stage.quit as quit_stage
-        new_flow = quit_stage.Quit(self.ui_spawner)
+        new_flow = quit_stage.Quit(self.ui_spawner, self.state)
         raise flow.ChangeFlow(new_flow, quit_stage.ENTRY_POINT)
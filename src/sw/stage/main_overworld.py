@@ -28,6 +28,7 @@ class MainOverworld(flow.SWFlow):
         player = self.state.player
         player.update_totals(self.state)
         player.health = player.max_health
+        self.state.world.pregenerate_areas(*self.state.player_position)
 
     #--------- event handlers ---------#
 
@@ -36,8 +37,7 @@ class MainOverworld(flow.SWFlow):
         if ev[0] != event.DESCEND:
             return False
         import sw.stage.main_dungeon as md
-        header = self.state.current_overworld_header()
-        area = header.load_or_generate_area()
+        area = self.state.world.load_area(*self.state.player_position)
         new_flow = md.MainDungeon(self.state, self.ui_spawner)
         raise flow.ChangeFlow(new_flow, md.FROM_OVERWORLD, area)
 
@@ -50,4 +50,5 @@ class MainOverworld(flow.SWFlow):
         new_xy = (x + dx, y + dy)
         self.state.player_position = new_xy
         self.state.world.generate_area_buffer(*new_xy)
+        self.state.world.pregenerate_areas(*new_xy)
         return True
@@ -1,7 +1,7 @@
 """
 Game finalization stage.
 
-Responsible for disposing of the UI.
+Responsible for disposing of the UI and the game state.
 """
 
 import sw.flow as flow
@@ -13,11 +13,13 @@ ENTRY_POINT = "the only"
 class Quit(flow.SWFlow):
     """ Game shutdown. """
 
-    def __init__(self, ui_spawner):
-        super().__init__(None, ui_spawner, None)
+    def __init__(self, ui_spawner, state=None):
+        super().__init__(state, ui_spawner, None)
         self.register_entry_point(ENTRY_POINT, self.quit)
 
     def quit(self):
         """ Quit the game. """
+        if self.state is not None:
+            self.state.close()
         self.ui_spawner.finish()
         raise flow.EndFlow()
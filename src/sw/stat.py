@@ -17,17 +17,28 @@ class HasStats():
     A class for things that have statistics.
     """
 
+    __slots__ = ()
+
     def __init__(self):
-        self.base_stats = empty_stat_dict()
+        self.totals_dirty = True
+        self._base_stats = empty_stat_dict()
         self.total_stats = empty_stat_dict()
 
     #--------- statistics manipulation - getters ---------#
 
+    @property
+    def base_stats(self):
+        """
+        :return: base statistics, grouped by StatGroup.
+        :rtype: dict
+        """
+        return self._base_stats
+
     @property
     def base_primary(self):
         """
         :return: base primary statistics.
-        :rtype: dict
+        :rtype: sw.enum_vector.EnumVector
         """
         return self.base_stats[stat.StatGroup.PRIMARY]
 
@@ -35,7 +46,7 @@ class HasStats():
     def base_secondary(self):
         """
         :return: base secondary statistics.
-        :rtype: dict
+        :rtype: sw.enum_vector.EnumVector
         """
         return self.base_stats[stat.StatGroup.SECONDARY]
 
@@ -43,7 +54,7 @@ class HasStats():
     def total_primary(self):
         """
         :return: total primary statistics.
-        :rtype: dict
+        :rtype: sw.enum_vector.EnumVector
         """
         return self.total_stats[stat.StatGroup.PRIMARY]
 
@@ -51,36 +62,51 @@ class HasStats():
     def total_secondary(self):
         """
         :return: total secondary statistics.
-        :rtype: dict
+        :rtype: sw.enum_vector.EnumVector
         """
         return self.total_stats[stat.StatGroup.SECONDARY]
 
     #--------- statistics manipulation - setters ---------#
 
+    @base_stats.setter
+    def base_stats(self, new):
+        """
+        Set base statistics.
+
+        :param dict new: new dict with base statistics, grouped by StatGroup.
+        """
+        self._base_stats = new
+        self.invalidate_totals()
+
     @base_primary.setter
     def base_primary(self, new):
         """"
         Set base primary statistics.
 
-        :param dict new: new dict with base primary statistics.
+        :param new: new vector with base primary statistics.
+        :type new: sw.enum_vector.EnumVector
         """
         self.base_stats[stat.StatGroup.PRIMARY] = new
+        self.invalidate_totals()
 
     @base_secondary.setter
     def base_secondary(self, new):
         """"
         Set base secondary statistics.
 
-        :param dict new: new dict with base secondary statistics.
+        :param new: new vector with base secondary statistics.
+        :type new: sw.enum_vector.EnumVector
         """
         self.base_stats[stat.StatGroup.SECONDARY] = new
+        self.invalidate_totals()
 
     @total_primary.setter
     def total_primary(self, new):
         """"
         Set total primary statistics.
 
-        :param dict new: new dict with total primary statistics.
+        :param new: new vector with total primary statistics.
+        :type new: sw.enum_vector.EnumVector
         """
         self.total_stats[stat.StatGroup.PRIMARY] = new
 
@@ -89,6 +115,13 @@ class HasStats():
         """"
         Set total secondary statistics.
 
-        :param dict new: new dict with total secondary statistics.
+        :param new: new vector with total secondary statistics.
+        :type new: sw.enum_vector.EnumVector
         """
         self.total_stats[stat.StatGroup.SECONDARY] = new
+
+    #--------- statistics manipulation - other ---------#
+
+    def invalidate_totals(self):
+        """ Mark total statistics as outdated. """
+        self.totals_dirty = True
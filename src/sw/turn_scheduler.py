@@ -0,0 +1,121 @@
+"""
+Turn scheduler module.
+
+Provides TurnScheduler class which hands out turns to actors in the order of
+the time they become ready to act.
+"""
+
+
+import heapq
+
+
+class TurnScheduler():
+    """
+    A priority queue of actors keyed by the time they are ready to act at.
+
+    Time is measured in action points. Actors are only touched when their turn
+    comes, so actors waiting for a long time cost nothing in between. Actors
+    with equal ready times act in the order they were scheduled in.
+
+    Suspended actors stay registered, but get no turns until resumed.
+    Scheduled actors have their 'turn_scheduler' attribute pointing to the
+    scheduler.
+    """
+
+    def __init__(self):
+        self.time = 0
+        self.queue = []
+        self.ready_at = {}
+        self.last_turn = {}
+        self.suspended = set()
+        # Tie breaker for actors ready at the same time
+        self._sequence = 0
+
+    def add(self, actor):
+        """
+        Start handing out turns to an actor, starting from the current time.
+
+        :param actor: the actor to schedule.
+        """
+        actor.turn_scheduler = self
+        self.last_turn[actor] = self.time
+        self._schedule(actor, self.time)
+
+    def remove(self, actor):
+        """
+        Stop handing out turns to an actor.
+
+        :param actor: the actor to unschedule.
+        """
+        self.ready_at.pop(actor, None)
+        self.last_turn.pop(actor, None)
+        self.suspended.discard(actor)
+        actor.turn_scheduler = None
+
+    def reschedule(self, actor, at, last_turn):
+        """
+        Set the time of the next turn of a scheduled actor and the time of its
+        last turn, e.g. when restoring it from a save.
+
+        :param actor: the actor to reschedule.
+        :param float at: the time of the next turn.
+        :param float last_turn: the time of the last turn.
+        """
+        self.last_turn[actor] = last_turn
+        self._schedule(actor, at)
+
+    def resume(self, actor):
+        """
+        Start handing out turns to a suspended actor again, starting from the
+        current time. Does nothing if the actor is not suspended.
+
+        :param actor: the actor to resume.
+        """
+        if actor not in self.suspended:
+            return
+        self.suspended.remove(actor)
+        self.last_turn[actor] = self.time
+        self._schedule(actor, self.time)
+
+    def suspend(self, actor):
+        """
+        Stop handing out turns to an actor until it is resumed.
+
+        :param actor: the actor to suspend.
+        """
+        if actor not in self.last_turn:
+            return
+        self.ready_at.pop(actor, None)
+        self.suspended.add(actor)
+
+    def advance(self, elapsed, take_turn):
+        """
+        Advance the time and let every actor that is ready act, in order.
+
+        :param float elapsed: the amount of action points that have passed.
+        :param take_turn: a callable accepting an actor and the amount of action
+        points it has accumulated since its last turn. It should return the
+        delay until the actor's next turn, or None to unschedule the actor.
+        """
+        self.time += elapsed
+        queue = self.queue
+        while queue and queue[0][0] <= self.time:
+            at, _, actor = heapq.heappop(queue)
+            if self.ready_at.get(actor) != at:
+                continue
+            delay = take_turn(actor, at - self.last_turn[actor])
+            if delay is None:
+                self.remove(actor)
+                continue
+            if actor in self.suspended:
+                continue
+            self.last_turn[actor] = at
+            self._schedule(actor, at + delay)
+
+    #--------- helper things ---------#
+
+    def _schedule(self, actor, at):
+        """ Put an actor into the queue. """
+        self.ready_at[actor] = at
+        self._sequence += 1
+        heapq.heappush(self.queue, (at, self._sequence, actor))
@@ -3,6 +3,9 @@ Curses-based UI for main dungeon view.
 """
 
 
+import math
+
+
 import mofloc
 
 
@@ -82,6 +85,7 @@ class MainDungeon(mofloc.EventSource, ui.MainDungeonWindow):
     def draw_area_view(self):
         """ Draw the area. """
         self._draw_area_background()
+        self._draw_terrain()
         self._draw_entities(
             self.state.area.doodads, self.uidata[md.DOODAD_MAP],
             self.uidata[md.SENSED_DOODAD_CHAR],
@@ -132,8 +136,9 @@ class MainDungeon(mofloc.EventSource, ui.MainDungeonWindow):
         char = self.uidata[md.EMPTY_SPACE_CHAR]
         seen_attr = curses.A_NORMAL
         unseen_attr = self._unseen_attr()
+        visibility_matrix = self.state.area.visibility_matrix
         for x, y in self.state.area.all_coordinates():
-            visible = self.state.area.visibility_matrix[(x, y)].visible()
+            visible = visibility_matrix.visible(x, y)
             x = x + offset_x
             y = y + offset_y
             self.area_view.addstr(y, x, char, seen_attr if visible else unseen_attr)
@@ -175,6 +180,28 @@ class MainDungeon(mofloc.EventSource, ui.MainDungeonWindow):
                 elif sense_func(visinfo):
                     self.area_view.addstr(y, x, sensed_char, unseen_attr)
 
+    def _draw_terrain(self):
+        """
+        Draw the terrain layer of the area.
+
+        Terrain never changes, so every seen position is drawn as remembered.
+        """
+        offset_x, offset_y = self._drawing_offsets()
+        unseen_attr = self._unseen_attr()
+        art_map = self.uidata[md.DOODAD_MAP]
+        visibility_matrix = self.state.area.visibility_matrix
+        for x, y, doodad in self.state.area.all_terrain():
+            visinfo = visibility_matrix[(x, y)]
+            if visinfo.never_seen():
+                continue
+            mapping = art_map[doodad.recipe_id]
+            char = mapping[md.MAP_CHAR]
+            if visinfo.visible():
+                attr = curses.color_from_dict(self.colors, mapping[md.MAP_COLOR])
+            else:
+                attr = unseen_attr
+            self.area_view.addstr(y + offset_y, x + offset_x, char, attr)
+
     def _draw_health_bar(self, y):
         """ Draw the health bar. """
         player = self.state.player
@@ -191,7 +218,9 @@ class MainDungeon(mofloc.EventSource, ui.MainDungeonWindow):
             color = curses.color_from_dict(colors, uidata[md.HIGH_HEALTH_COLOR])
         w = self.status_box.getmaxyx()[1] - 2
         string = uidata[md.HEALTH_BAR_CHAR] * int(w * ratio)
-        title = uidata[md.HEALTH].format(current=current, maximum=maximum)
+        # Stats are stored as floats, but are shown as whole numbers. A living
+        # character never shows zero health
+        title = uidata[md.HEALTH].format(current=math.ceil(current), maximum=round(maximum))
         self.status_box.addstr(y, 1, title)
         self.status_box.addstr(y + 1, 1, string, color)
 
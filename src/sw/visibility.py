@@ -1,16 +1,14 @@
 """
 Visibility module.
 
-Provides is_transparent function and VisibilityInfo class.
+Provides is_transparent function, VisibilityMatrix and VisibilityInfo classes.
 """
 
 
-from multipledispatch import dispatch
-
-
 import sw.character as char
 import sw.const.visibility as const
 import sw.doodad as doodad
+from sw.dispatch import dispatch
 import sw.entity as entity
 import sw.monster as monster
 import sw.player as player
@@ -39,22 +37,167 @@ def is_transparent(wall, _other):
     return wall.transparent
 
 
+#--------- visibility matrix ---------#
+
+
+# Maps every visibility bitmask to the same bitmask without 'VISIBLE'
+_WITHOUT_VISIBLE = bytes(level & ~const.VisibilityLevel.VISIBLE for level in range(256))
+
+
+class VisibilityMatrix():
+    """
+    Remembered and sensed information about every position in an area.
+
+    Visibility levels are stored as VisibilityLevel bitmasks, one byte per
+    position. Remembered entities are kept in a sparse table which only has
+    entries for positions where something was seen.
+    """
+
+    def __init__(self, width, height, base_level=const.VisibilityLevel.NEVER_SEEN):
+        """
+        Initialize a visibility matrix.
+
+        :param int width: the width of the area the matrix describes.
+        :param int height: the height of the area the matrix describes.
+        :param base_level: the initial visibility level of every position.
+        :type base_level: sw.const.visibility.VisibilityLevel
+        """
+        self.width = width
+        self.height = height
+        self.levels = bytearray([base_level]) * (width * height)
+        self.remembered = {}
+
+    def __getitem__(self, position):
+        """
+        :param position: a position in the area.
+        :type position: tuple(int, int)
+
+        :return: a view on the information about the position.
+        :rtype: VisibilityInfo
+        """
+        x, y = position
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise KeyError(position)
+        return VisibilityInfo(self, y * self.width + x)
+
+    def add_level(self, x, y, level):
+        """
+        Add a visibility level to a position.
+
+        :param int x: the X coordinate of the position.
+        :param int y: the Y coordinate of the position.
+        :param level: the level to add.
+        :type level: sw.const.visibility.VisibilityLevel
+        """
+        self.levels[y * self.width + x] |= level
+
+    def discard_level(self, x, y, level):
+        """
+        Remove a visibility level from a position, if it's there.
+
+        :param int x: the X coordinate of the position.
+        :param int y: the Y coordinate of the position.
+        :param level: the level to remove.
+        :type level: sw.const.visibility.VisibilityLevel
+        """
+        self.levels[y * self.width + x] &= ~level
+
+    def explored_levels(self):
+        """
+        :return: the visibility levels of all positions without the 'VISIBLE'
+        flags, that is the levels the player keeps after leaving the area.
+        :rtype: bytes
+        """
+        return self.levels.translate(_WITHOUT_VISIBLE)
+
+    def remember(self, x, y, doodads, items, monsters):
+        """
+        Mark a position as visible and remember what is there.
+
+        :param int x: the X coordinate of the position.
+        :param int y: the Y coordinate of the position.
+        :param list doodads: doodads at the position.
+        :param list items: items at the position.
+        :param list monsters: monsters at the position.
+        """
+        index = y * self.width + x
+        self.levels[index] = const.VisibilityLevel.VISIBLE
+        if doodads or items or monsters:
+            self.remembered[index] = (doodads, items, monsters)
+        else:
+            self.remembered.pop(index, None)
+
+    def visible(self, x, y):
+        """
+        :return: True if a given position is visible, False otherwise.
+        :rtype: bool
+        """
+        return bool(self.levels[y * self.width + x] & const.VisibilityLevel.VISIBLE)
+
+
 #--------- visibility info class ---------#
 
 
+_NOTHING_REMEMBERED = ((), (), ())
+
+
 class VisibilityInfo():
     """
-    A class containing remembered and sensed information about a position.
+    A view on the remembered and sensed information about a single position,
+    backed by a VisibilityMatrix.
     """
 
-    def __init__(self, base_level=None):
-        if base_level is None:
-            self.levels = {}
-        else:
-            self.levels = {base_level}
-        self.remembered_doodads = []
-        self.remembered_items = []
-        self.remembered_monsters = []
+    def __init__(self, matrix, index):
+        """
+        Initialize a view.
+
+        :param VisibilityMatrix matrix: the matrix holding the information.
+        :param int index: the index of the position in the matrix.
+        """
+        self.matrix = matrix
+        self.index = index
+
+    @property
+    def levels(self):
+        """
+        :return: visibility levels of the position.
+        :rtype: sw.const.visibility.VisibilityLevel
+        """
+        return const.VisibilityLevel(self.matrix.levels[self.index])
+
+    @levels.setter
+    def levels(self, new):
+        """
+        Set visibility levels of the position.
+
+        :param new: the new levels.
+        :type new: sw.const.visibility.VisibilityLevel
+        """
+        self.matrix.levels[self.index] = new
+
+    @property
+    def remembered_doodads(self):
+        """
+        :return: doodads remembered to be at the position.
+        :rtype: list[sw.doodad.Doodad]
+        """
+        return self.matrix.remembered.get(self.index, _NOTHING_REMEMBERED)[0]
+
+    @property
+    def remembered_items(self):
+        """
+        :return: items remembered to be at the position.
+        :rtype: list[sw.item.Item]
+        """
+        return self.matrix.remembered.get(self.index, _NOTHING_REMEMBERED)[1]
+
+    @property
+    def remembered_monsters(self):
+        """
+        :return: monsters remembered to be at the position.
+        :rtype: list[sw.monster.Monster]
+        """
+        return self.matrix.remembered.get(self.index, _NOTHING_REMEMBERED)[2]
 
     def never_seen(self):
         """
@@ -62,7 +205,7 @@ class VisibilityInfo():
         otherwise.
         :rtype: bool
         """
-        return const.VisibilityLevel.NEVER_SEEN in self.levels
+        return bool(self.matrix.levels[self.index] & const.VisibilityLevel.NEVER_SEEN)
 
     def sense_doodads(self):
         """
@@ -70,7 +213,7 @@ class VisibilityInfo():
         otherwise.
         :rtype: bool
         """
-        return const.VisibilityLevel.SENSE_DOODADS in self.levels
+        return bool(self.matrix.levels[self.index] & const.VisibilityLevel.SENSE_DOODADS)
 
     def sense_items(self):
         """
@@ -78,7 +221,7 @@ class VisibilityInfo():
         otherwise.
         :rtype: bool
         """
-        return const.VisibilityLevel.SENSE_ITEMS in self.levels
+        return bool(self.matrix.levels[self.index] & const.VisibilityLevel.SENSE_ITEMS)
 
     def sense_monsters(self):
         """
@@ -86,11 +229,11 @@ class VisibilityInfo():
         otherwise.
         :rtype: bool
         """
-        return const.VisibilityLevel.SENSE_MONSTERS in self.levels
+        return bool(self.matrix.levels[self.index] & const.VisibilityLevel.SENSE_MONSTERS)
 
     def visible(self):
         """
         :return: True if the point this info refers to is visible, False
         otherwise.
         """
-        return const.VisibilityLevel.VISIBLE in self.levels
+        return bool(self.matrix.levels[self.index] & const.VisibilityLevel.VISIBLE)
@@ -6,11 +6,35 @@ load it from and save it to disk.
 """
 
 
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import os
+import random
+import shutil
+import tempfile
+
+
+from sw.area import area_from_save, area_to_save
 import sw.area_header as ah
 import sw.const.area as aconst
+from sw.const.save import RecordKind
+from sw.save import SaveWriter, open_save
 
 
+# The default radius of the square of areas kept generated around the player
 MIN_AREA_BUFFER = 7
+# The default maximum number of areas generated per overworld step
+AREA_GENERATION_BUDGET = 32
+# The default maximum number of areas kept in memory at once
+MAX_LIVE_AREAS = 8
+# The extension of files with evicted areas
+AREA_FILE_SUFFIX = ".area"
+# Areas within this distance from the player on the overworld are generated in
+# the background
+PREGENERATION_RADIUS = 1
+# The number of threads generating areas in the background
+PREGENERATION_WORKERS = 2
 
 
 #--------- main classes ---------#
@@ -30,8 +54,21 @@ class World():
         """
         self.name = None
         self.data = data
+        self.seed = 0
         self.save_dir = None
         self.area_headers = {}
+        self.buffer_radius = MIN_AREA_BUFFER
+        self.generation_budget = AREA_GENERATION_BUDGET
+        self.buffer_center = None
+        self.pending_areas = deque()
+        self.max_live_areas = MAX_LIVE_AREAS
+        # Areas in memory, from the least to the most recently used
+        self.live_areas = OrderedDict()
+        self.temp_dir = None
+        # Areas being generated in the background, as futures
+        self.pregenerated_areas = {}
+        self.pregeneration_radius = PREGENERATION_RADIUS
+        self.executor = None
 
     #--------- area manipulation ---------#
 
@@ -44,48 +81,338 @@ class World():
         """
         if (x, y) in self.area_headers:
             return
-        area = ah.area_header_from_scratch(self.data, None, aconst.ArcanumLevel.ZERO)
+        area = ah.area_header_from_scratch(self.data, None, aconst.ArcanumLevel.ZERO,
+                                           area_seed(self.seed, x, y))
         self.area_headers[(x, y)] = area
-                                                                
+
+    def load_area(self, x, y):
+        """
+        Return the area at the given coordinates, reloading it from disk or
+        generating it from its header if it's not in memory.
+
+        At most 'max_live_areas' areas are kept in memory; the least recently
+        used ones are written to files in the world's save directory and
+        dropped.
+
+        :param int x: X coordinate of the area.
+        :param int y: Y coordinate of the area.
+
+        :return: the area.
+        :rtype: sw.area.Area
+        """
+        key = (x, y)
+        area = self.live_areas.get(key)
+        if area is not None:
+            self.live_areas.move_to_end(key)
+            return area
+        future = self.pregenerated_areas.pop(key, None)
+        path = self._area_file(x, y)
+        if future is not None and not future.cancel():
+            area = future.result()
+        elif path is not None:
+            area = self._read_area(path)
+        else:
+            area = self.area_headers[key].load_or_generate_area()
+        self.live_areas[key] = area
+        while len(self.live_areas) > max(self.max_live_areas, 1):
+            (old_x, old_y), old_area = self.live_areas.popitem(last=False)
+            old_area.remove_player()
+            self._write_area(old_area, self._temp_area_path(old_x, old_y))
+        return area
+
+    def pregenerate_areas(self, around_x, around_y):
+        """
+        Start generating areas around given coordinates in the background, so
+        that loading them later is fast. Background generation of areas
+        farther away is cancelled.
+
+        Only areas which are neither in memory nor on disk are generated.
+
+        :param int around_x: X coordinate of the center of the neighbourhood.
+        :param int around_y: Y coordinate of the center of the neighbourhood.
+        """
+        radius = self.pregeneration_radius
+        wanted = set()
+        for x in range(around_x - radius, around_x + radius + 1):
+            for y in range(around_y - radius, around_y + radius + 1):
+                key = (x, y)
+                if (key in self.area_headers and key not in self.live_areas
+                        and self._area_file(x, y) is None):
+                    wanted.add(key)
+        for key in list(self.pregenerated_areas):
+            if key not in wanted:
+                self.pregenerated_areas.pop(key).cancel()
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(PREGENERATION_WORKERS, "sw-pregeneration")
+        for key in sorted(wanted - self.pregenerated_areas.keys()):
+            header = self.area_headers[key]
+            self.pregenerated_areas[key] = self.executor.submit(header.load_or_generate_area)
 
     def generate_area_buffer(self, around_x, around_y):
         """
-        Generate buffer areas around given coordinates, that is, add new areas
-        in a rectangle centered around them.
+        Move the buffer of generated areas to be centered around given
+        coordinates.
+
+        The area at the center is generated immediately. Areas newly exposed
+        at the edge of the buffer are queued and generated at most
+        'generation_budget' at a time. The queue is kept ordered by distance
+        from the new center, so areas closest to the center are generated
+        first.
 
         :param int around_x: X coordinate of the center of the buffer.
         :param int around_y: Y coordinate of the center of the buffer.
         """
-        for x in range(around_x - MIN_AREA_BUFFER, around_x + MIN_AREA_BUFFER):
-            for y in range(around_y - MIN_AREA_BUFFER, around_y + MIN_AREA_BUFFER):
-                self.add_area(x, y)
+        center = (around_x, around_y)
+        self.add_area(around_x, around_y)
+        pending = list(self.pending_areas)
+        if self.buffer_center is None:
+            pending.extend(_square(center, self.buffer_radius))
+        else:
+            pending.extend(_exposed(self.buffer_center, center, self.buffer_radius))
+        pending.sort(key=lambda key: max(abs(key[0] - around_x), abs(key[1] - around_y)))
+        self.pending_areas = deque(pending)
+        self.buffer_center = center
+        self.generate_pending_areas(self.generation_budget)
 
+    def generate_pending_areas(self, budget=None):
+        """
+        Generate queued buffer areas. Areas that have left the buffer while
+        waiting are dropped from the queue.
 
-#--------- world creation from saved YAML dicts ---------#
+        :param budget: the maximum number of areas to generate or None to
+        generate all of them.
+        :type budget: int or None
+        """
+        pending = self.pending_areas
+        center_x, center_y = self.buffer_center
+        radius = self.buffer_radius
+        while pending and (budget is None or budget > 0):
+            x, y = pending.popleft()
+            if (x, y) in self.area_headers:
+                continue
+            if abs(x - center_x) > radius or abs(y - center_y) > radius:
+                continue
+            self.add_area(x, y)
+            if budget is not None:
+                budget -= 1
 
+    #--------- area files ---------#
 
-def world_from_save(gamedata, save):
+    def close(self):
+        """
+        Release the resources held by the world: stop background generation
+        of areas and remove evicted areas. Areas evicted since the last save
+        are lost.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+        self.pregenerated_areas.clear()
+        if self.temp_dir is not None:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.temp_dir = None
+
+    def save_areas(self, directory):
+        """
+        Write all visited areas to a save directory, which becomes the world's
+        save directory. Areas are written without the player.
+
+        Evicted areas are kept in a temporary directory and only get into a
+        save directory here, so the save on disk changes only when the game is
+        saved.
+
+        :param str directory: the path to the directory.
+        """
+        os.makedirs(directory, exist_ok=True)
+        if self.save_dir is not None and (os.path.abspath(self.save_dir)
+                                          != os.path.abspath(directory)):
+            for name in _area_file_names(self.save_dir):
+                shutil.copyfile(os.path.join(self.save_dir, name), os.path.join(directory, name))
+        if self.temp_dir is not None:
+            for name in _area_file_names(self.temp_dir):
+                shutil.move(os.path.join(self.temp_dir, name), os.path.join(directory, name))
+        self.save_dir = directory
+        for (x, y), area in self.live_areas.items():
+            self._write_area(area, os.path.join(directory, _area_file_name(x, y)))
+
+    def _area_file(self, x, y):
+        """
+        Return the path to the file with the evicted or saved area at given
+        coordinates, or None if there's no such file. Areas evicted since the
+        last save take precedence over the saved ones.
+        """
+        for directory in (self.temp_dir, self.save_dir):
+            if directory is not None:
+                path = os.path.join(directory, _area_file_name(x, y))
+                if os.path.exists(path):
+                    return path
+        return None
+
+    def _temp_area_path(self, x, y):
+        """ Return the path to evict the area at given coordinates to. """
+        if self.temp_dir is None:
+            self.temp_dir = tempfile.mkdtemp(prefix="sw-areas-")
+        return os.path.join(self.temp_dir, _area_file_name(x, y))
+
+    def _read_area(self, path):
+        """ Read an evicted or saved area from a file. """
+        return area_from_save(self.data, open_save(path, RecordKind.AREA))
+
+    def _write_area(self, area, path):
+        """ Write an area to a file so that it can be dropped from memory. """
+        save = SaveWriter(RecordKind.AREA)
+        area_to_save(area, save)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        save.dump(path)
+
+
+#--------- world creation from saves ---------#
+
+
+def world_from_save(gamedata, save, directory):
     """
-    Generate a world from a save.
+    Generate a world from a save. Areas are not read until they are needed.
 
     :param gamedata: game data used to repopulate the world with things.
     :type gamedata: sw.gamedata.GameData
-    :param dict save: saved info about the world.
+    :param save: a reader positioned at the world.
+    :type save: sw.save.SaveReader
+    :param str directory: the save directory with the area files.
+
+    :return: the regenerated world.
+    :rtype: World
+    """
+    res = World(gamedata)
+    res.save_dir = directory
+    res.name = save.read_id()
+    res.seed = save.read_uint()
+    res.buffer_center = save.read_position()
+    for key in save.read_positions():
+        res.area_headers[key] = ah.area_header_from_save(gamedata, save)
+    res.pending_areas.extend(save.read_positions())
+    return res
+
+
+#--------- writing worlds to saves ---------#
+
+
+def world_to_save(world, save):
+    """
+    Write a world to a save. Only the overworld is written, areas are kept
+    in separate files by 'World.save_areas'.
+
+    :param World world: the world to write.
+    :param save: the writer to write to.
+    :type save: sw.save.SaveWriter
     """
-    raise NotImplementedError
+    save.write_id(world.name)
+    save.write_uint(world.seed)
+    save.write_position(world.buffer_center)
+    save.write_positions(list(world.area_headers))
+    for header in world.area_headers.values():
+        ah.area_header_to_save(header, save)
+    save.write_positions(list(world.pending_areas))
 
 
 #--------- world creation from scratch ---------#
 
 
-def world_from_scratch(gamedata):
+def world_from_scratch(gamedata, seed=None):
     """
     Generate a world from scratch.
 
     :param gamedata: game data used to populate the world.
     :type gamedata: sw.gamedata.GameData
+    :param seed: the seed all areas of the world are generated from, random
+    if None.
+    :type seed: int or None
     """
     res = World(gamedata)
     res.name = "TEMP WORLD NAME"
+    res.seed = random.getrandbits(64) if seed is None else seed
     res.generate_area_buffer(0, 0)
+    res.generate_pending_areas()
+    return res
+
+
+#--------- helper things ---------#
+
+
+def _area_file_name(x, y):
+    """ Return the name of the file with the area at given coordinates. """
+    return f"area_{x}_{y}{AREA_FILE_SUFFIX}"
+
+
+def _area_file_names(directory):
+    """ Return the names of all area files in a directory. """
+    return [name for name in os.listdir(directory) if name.endswith(AREA_FILE_SUFFIX)]
+
+
+def area_seed(world_seed, x, y):
+    """
+    Derive the seed of an area from the seed of the world and the area's
+    overworld coordinates. The result doesn't depend on the order in which
+    areas are generated, nor on the Python process.
+
+    :param int world_seed: the seed of the world.
+    :param int x: X coordinate of the area.
+    :param int y: Y coordinate of the area.
+
+    :return: the seed of the area.
+    :rtype: int
+    """
+    key = f"{world_seed}:{x}:{y}".encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def _exposed(old_center, new_center, radius):
+    """
+    Compute coordinates in a square around a new center which are not in the
+    square of the same radius around an old center.
+
+    Takes time proportional to the number of such coordinates.
+
+    :param old_center: the center of the old square.
+    :type old_center: tuple(int, int)
+    :param new_center: the center of the new square.
+    :type new_center: tuple(int, int)
+    :param int radius: the radius of the squares.
+
+    :return: a list of coordinates.
+    :rtype: list[tuple(int, int)]
+    """
+    old_x, old_y = old_center
+    new_x, new_y = new_center
+    if max(abs(new_x - old_x), abs(new_y - old_y)) > 2 * radius:
+        return _square(new_center, radius)
+    xs = range(new_x - radius, new_x + radius + 1)
+    ys = range(new_y - radius, new_y + radius + 1)
+    new_columns = [x for x in xs if abs(x - old_x) > radius]
+    new_rows = [y for y in ys if abs(y - old_y) > radius]
+    res = [(x, y) for x in new_columns for y in ys]
+    if new_rows:
+        res.extend((x, y) for x in xs if abs(x - old_x) <= radius for y in new_rows)
+    return res
+
+
+def _square(center, radius):
+    """
+    List coordinates in a square around a center, ring by ring from the center
+    outwards.
+
+    :param center: the center of the square.
+    :type center: tuple(int, int)
+    :param int radius: the radius of the square.
+
+    :return: a list of coordinates.
+    :rtype: list[tuple(int, int)]
+    """
+    center_x, center_y = center
+    res = [center]
+    for ring in range(1, radius + 1):
+        for offset in range(-ring, ring):
+            res.append((center_x + offset, center_y - ring))
+            res.append((center_x + ring, center_y + offset))
+            res.append((center_x - offset, center_y + ring))
+            res.append((center_x - ring, center_y - offset))
     return res